@@ -24,6 +24,10 @@ a = Analysis(
         'numpy.lib.format',
         'openpyxl',
         'openpyxl.cell._writer',
+        'lxml',
+        'lxml.etree',
+        'xlsxwriter',
+        'python_calamine',
         'fitz',
         'fitz.fitz',
         'unidecode',
@@ -10,11 +10,29 @@ Handles:
 import pandas as pd
 import logging
 import os
+from pandas.api.types import union_categoricals
 
-from utils.normalization import normalize_ref, standardize_column_names
+from utils.normalization import normalize_ref_series, standardize_column_names
 
 logger = logging.getLogger(__name__)
 
+# python-calamine (Rust) reads workbook values much faster than openpyxl; optional
+try:
+    import python_calamine  # noqa: F401
+    EXCEL_READ_ENGINE = 'calamine'
+except ImportError:
+    EXCEL_READ_ENGINE = None  # pandas default (openpyxl)
+
+
+def _read_excel(filepath, **kwargs):
+    """Read an Excel sheet with the fastest available engine, falling back to openpyxl."""
+    if EXCEL_READ_ENGINE:
+        try:
+            return pd.read_excel(filepath, engine=EXCEL_READ_ENGINE, **kwargs)
+        except Exception as e:
+            logger.warning("calamine could not read %s (%s), using openpyxl", os.path.basename(filepath), e)
+    return pd.read_excel(filepath, **kwargs)
+
 
 def _forward_fill(series):
     """Forward-fill missing values. Use this instead of fillna(method='ffill') for pandas 2.2+ compatibility."""
@@ -49,7 +67,7 @@ def load_ventrata(filepath):
     logger.info(f"Loading Ventrata data from: {filepath}")
     
     # Load Excel file
-    df = pd.read_excel(filepath)
+    df = _read_excel(filepath)
     
     logger.info(f"Loaded {len(df)} rows from Ventrata file")
     logger.info(f"Original columns: {list(df.columns)}")
@@ -73,7 +91,7 @@ def load_ventrata(filepath):
     # Add normalized order reference column for merging
     order_ref_col = column_map.get('order reference')
     if order_ref_col:
-        df['_normalized_order_ref'] = df[order_ref_col].apply(normalize_ref)
+        df['_normalized_order_ref'] = normalize_ref_series(df[order_ref_col])
         logger.info(f"Added normalized order reference column")
     
     logger.info(f"Successfully loaded Ventrata data with {len(df)} rows")
@@ -108,10 +126,10 @@ def load_monday(filepath):
     
     # Load Excel file (Monday exports typically have header at row 3, index 2)
     try:
-        df = pd.read_excel(filepath, header=2)
+        df = _read_excel(filepath, header=2)
     except Exception:
         # Fallback to default header row
-        df = pd.read_excel(filepath)
+        df = _read_excel(filepath)
     
     logger.info(f"Loaded {len(df)} rows from Monday file")
     logger.info(f"Original columns: {list(df.columns)}")
@@ -135,7 +153,7 @@ def load_monday(filepath):
     # Add normalized order reference column for merging
     order_ref_col = column_map.get('order reference')
     if order_ref_col:
-        df['_normalized_order_ref'] = df[order_ref_col].apply(normalize_ref)
+        df['_normalized_order_ref'] = normalize_ref_series(df[order_ref_col])
         logger.info(f"Added normalized order reference column")
     
     # Filter out header rows and invalid data
@@ -283,7 +301,7 @@ def load_update_file(filepath):
     logger.info(f"Loading update file from: {filepath}")
     
     # Load Excel file
-    df = pd.read_excel(filepath)
+    df = _read_excel(filepath)
     
     logger.info(f"Loaded {len(df)} rows from update file")
     logger.info(f"Original columns: {list(df.columns)}")
@@ -324,7 +342,7 @@ def load_update_file(filepath):
     
     # Add normalized order reference for matching
     if order_ref_col:
-        df['_normalized_order_ref'] = df[order_ref_col].apply(normalize_ref)
+        df['_normalized_order_ref'] = normalize_ref_series(df[order_ref_col])
         logger.info(f"Added normalized order reference column")
     
     # Extract row fill colors by ID (for preserving colors when saving results)
@@ -380,11 +398,16 @@ def merge_data(ventrata_df, monday_df=None):
     if common_cols:
         logger.info(f"Found {len(common_cols)} common columns: {sorted(common_cols)}")
         # Rename Monday common columns to avoid conflicts; keep Ventrata columns unchanged.
-        ventrata_df = ventrata_df.copy()
-        monday_df = monday_df.copy()
-        
-        for col in common_cols:
-            monday_df = monday_df.rename(columns={col: f'monday_{col}'})
+        monday_df = monday_df.rename(columns={col: f'monday_{col}' for col in common_cols})
+    
+    # Join on integer category codes instead of hashing strings: give both keys
+    # the same categories (on copies, so the callers' frames keep their dtype)
+    key_dtype = ventrata_df['_normalized_order_ref'].dtype
+    ventrata_key = ventrata_df['_normalized_order_ref'].astype('category')
+    monday_key = monday_df['_normalized_order_ref'].astype('category')
+    key_categories = union_categoricals([ventrata_key, monday_key]).categories
+    ventrata_df = ventrata_df.assign(_normalized_order_ref=ventrata_key.cat.set_categories(key_categories))
+    monday_df = monday_df.assign(_normalized_order_ref=monday_key.cat.set_categories(key_categories))
     
     # Perform merge
     merged_df = pd.merge(
@@ -394,6 +417,7 @@ def merge_data(ventrata_df, monday_df=None):
         how='inner',
         suffixes=('_ventrata', '_monday')
     )
+    merged_df['_normalized_order_ref'] = merged_df['_normalized_order_ref'].astype(key_dtype)
     
     logger.info(f"Merged data contains {len(merged_df)} rows")
     logger.info(f"Merged columns: {list(merged_df.columns)}")
@@ -9,6 +9,19 @@ from unidecode import unidecode
 
 logger = logging.getLogger(__name__)
 
+# Patterns used by clean_name / validate_name_structure, compiled once at import
+_LEADING_NUMBERING = re.compile(r'^[\d\.\-\s]*')
+_LEADING_DASHES = re.compile(r'^[\s\-]+')
+_TRAILING_DASH_DOB = re.compile(r'\s*-\s*DOB\s*$', re.IGNORECASE)
+_TRAILING_DASH = re.compile(r'\s*-\s*$')
+_TRAILING_DOB = re.compile(r'\s*DOB\s*$', re.IGNORECASE)
+_TRAILING_DOT = re.compile(r'\s*\.\s*$')
+_TRAILING_DATE = re.compile(r'\s*-\s*\d{1,2}[/\.\-]\d{1,2}[/\.\-]\d{2,4}.*$')
+_TRAILING_DASH_AGE = re.compile(r'\s*-\s*\d+\s*(ans|years?|yrs?|yo|age)\s*$', re.IGNORECASE)
+_TRAILING_PAREN_AGE = re.compile(r'\s*\(\s*\d+\s*(ans|years?|yrs?|yo|age)\s*\)\s*$', re.IGNORECASE)
+_WHITESPACE_RUN = re.compile(r'\s+')
+_NAME_WORD = re.compile(r"^[A-Za-zÀ-ÿĀ-žА-я\u00C0-\u017F\u1E00-\u1EFF\u0100-\u024F'\.\-]+$")
+
 
 class BaseExtractor(ABC):
     """
@@ -74,25 +87,25 @@ class BaseExtractor(ABC):
         name = name.strip()
         
         # Remove leading numbers, dots, dashes
-        name = re.sub(r'^[\d\.\-\s]*', '', name)
-        name = re.sub(r'^[\s\-]+', '', name)
+        name = _LEADING_NUMBERING.sub('', name)
+        name = _LEADING_DASHES.sub('', name)
         
         # Remove trailing text like "DOB", dashes, dots
-        name = re.sub(r'\s*-\s*DOB\s*$', '', name, flags=re.IGNORECASE)
-        name = re.sub(r'\s*-\s*$', '', name)
-        name = re.sub(r'\s*DOB\s*$', '', name, flags=re.IGNORECASE)
-        name = re.sub(r'\s*\.\s*$', '', name)
+        name = _TRAILING_DASH_DOB.sub('', name)
+        name = _TRAILING_DASH.sub('', name)
+        name = _TRAILING_DOB.sub('', name)
+        name = _TRAILING_DOT.sub('', name)
         
         # Remove common trailing date indicators
-        name = re.sub(r'\s*-\s*\d{1,2}[/\.\-]\d{1,2}[/\.\-]\d{2,4}.*$', '', name)
+        name = _TRAILING_DATE.sub('', name)
         
         # Remove age indicators (French: "ans", English: "years", "yrs", "yo", etc.)
         # Pattern: "- 41 ans" or "- 16 years" or "- 25 yrs" or "- 30 yo"
-        name = re.sub(r'\s*-\s*\d+\s*(ans|years?|yrs?|yo|age)\s*$', '', name, flags=re.IGNORECASE)
-        name = re.sub(r'\s*\(\s*\d+\s*(ans|years?|yrs?|yo|age)\s*\)\s*$', '', name, flags=re.IGNORECASE)
+        name = _TRAILING_DASH_AGE.sub('', name)
+        name = _TRAILING_PAREN_AGE.sub('', name)
         
         # Clean up multiple spaces
-        name = re.sub(r'\s+', ' ', name)
+        name = _WHITESPACE_RUN.sub(' ', name)
         
         # Normalize accented characters to ASCII (e.g., Zárate → Zarate, Müller → Muller)
         name = unidecode(name)
@@ -134,7 +147,7 @@ class BaseExtractor(ABC):
         
         # All words must be valid name characters
         for word in words:
-            if not re.match(r"^[A-Za-zÀ-ÿĀ-žА-я\u00C0-\u017F\u1E00-\u1EFF\u0100-\u024F'\.\-]+$", word):
+            if not _NAME_WORD.match(word):
                 return False
         
         return True
@@ -394,7 +394,6 @@ class MainWindow(QMainWindow):
         # Create and start worker thread
         self.worker = ExtractionWorker(ventrata_file, monday_file, update_file, output_dir)
         self.worker.progress_updated.connect(self._on_progress_updated)
-        self.worker.warning_added.connect(self._on_warning_added)
         self.worker.finished.connect(self._on_extraction_finished)
         self.worker.error_occurred.connect(self._on_error_occurred)
         self.worker.start()
@@ -425,16 +424,6 @@ class MainWindow(QMainWindow):
             step_display = step.capitalize()
             self.progress_label.setText(f"✓ Completed: {step_display}")
     
-    def _on_warning_added(self, warning: str):
-        """
-        Handle warning addition.
-        
-        Args:
-            warning: Warning message
-        """
-        # Warnings are now handled in the completion message
-        pass
-    
     def _on_extraction_finished(self, success: bool, message: str, output_file: str):
         """
         Handle extraction completion.
@@ -2,16 +2,21 @@
 Worker thread for background processing to keep UI responsive.
 """
 
-from PyQt6.QtCore import QThread, pyqtSignal
+from PyQt6.QtCore import QThread, QElapsedTimer, pyqtSignal
 import pandas as pd
 import logging
+import os
+from collections import Counter
 
 from data_loader import load_ventrata, load_monday, load_update_file, merge_data
-from processor import NameExtractionProcessor
+from processor import NameExtractionProcessor, process_in_parallel
 from main import save_results_to_excel, get_next_available_filename
 
 logger = logging.getLogger(__name__)
 
+# Minimum time between batched warning emissions (milliseconds)
+WARNING_FLUSH_INTERVAL_MS = 100
+
 
 class ExtractionWorker(QThread):
     """
@@ -19,13 +24,14 @@ class ExtractionWorker(QThread):
     
     Signals:
         progress_updated: (step: str, state: str, details: str)
-        warning_added: (warning: str)
+        warnings_batched: (warnings: list) - buffered warnings, flushed on step
+            transitions or every WARNING_FLUSH_INTERVAL_MS
         finished: (success: bool, message: str, output_file: str)
         error_occurred: (error_message: str)
     """
     
     progress_updated = pyqtSignal(str, str, str)  # step, state, details
-    warning_added = pyqtSignal(str)  # warning message
+    warnings_batched = pyqtSignal(list)  # list of warning messages
     finished = pyqtSignal(bool, str, str)  # success, message, output_file
     error_occurred = pyqtSignal(str)  # error message
     
@@ -47,12 +53,33 @@ class ExtractionWorker(QThread):
         self.update_file = update_file
         self.output_dir = output_dir
         self._is_running = True
+        self._warning_buf = []
+        self._last_flush = QElapsedTimer()
+    
+    def _add_warning(self, warning: str):
+        """Buffer a warning; emit the buffer once the flush interval has elapsed."""
+        self._warning_buf.append(warning)
+        if self._last_flush.elapsed() > WARNING_FLUSH_INTERVAL_MS:
+            self._flush_warnings()
+    
+    def _flush_warnings(self):
+        """Emit all buffered warnings in a single cross-thread signal."""
+        if self._warning_buf:
+            self.warnings_batched.emit(self._warning_buf)
+            self._warning_buf = []
+        self._last_flush.restart()
+    
+    def _emit_progress(self, step: str, state: str, details: str):
+        """Flush pending warnings, then report a step transition."""
+        self._flush_warnings()
+        self.progress_updated.emit(step, state, details)
     
     def run(self):
         """Execute the extraction process."""
+        self._last_flush.start()
         try:
             # Step 1: Import Files
-            self.progress_updated.emit('import', 'loading', 'Loading files...')
+            self._emit_progress('import', 'loading', 'Loading files...')
             
             logger.info(f"Loading Ventrata file: {self.ventrata_file}")
             ventrata_df = load_ventrata(self.ventrata_file)
@@ -69,18 +96,20 @@ class ExtractionWorker(QThread):
             if self.update_file:
                 logger.info(f"Loading update file: {self.update_file}")
                 update_df, update_row_colors = load_update_file(self.update_file)
+                update_df = NameExtractionProcessor.select_update_columns(update_df)
                 files_loaded += 1
             
-            self.progress_updated.emit(
+            self._emit_progress(
                 'import', 'complete', 
                 f'✓ Loaded {files_loaded} file{"s" if files_loaded > 1 else ""}'
             )
             
             if not self._is_running:
+                self._flush_warnings()
                 return
             
             # Step 2: Merge Lists
-            self.progress_updated.emit('merge', 'loading', 'Merging data...')
+            self._emit_progress('merge', 'loading', 'Merging data...')
             
             if monday_df is not None:
                 merged_df = merge_data(ventrata_df, monday_df)
@@ -90,32 +119,32 @@ class ExtractionWorker(QThread):
                 logger.info("No Monday file - processing Ventrata only")
             
             bookings_count = merged_df['_normalized_order_ref'].nunique() if '_normalized_order_ref' in merged_df.columns else len(merged_df)
-            self.progress_updated.emit(
+            self._emit_progress(
                 'merge', 'complete', 
                 f'✓ {bookings_count} booking{"s" if bookings_count != 1 else ""}'
             )
             
             if not self._is_running:
+                self._flush_warnings()
                 return
             
             # Step 3: Verify Names (Name Extraction & Validation)
-            self.progress_updated.emit(
+            self._emit_progress(
                 'verify', 'loading', 
                 'Extracting and validating names...'
             )
             
-            processor = NameExtractionProcessor(merged_df, monday_df, update_df)
-            results_df = processor.process()
+            results_df = process_in_parallel(merged_df, monday_df, update_df)
             
             if results_df.empty:
                 self.error_occurred.emit("No data was extracted!")
-                self.progress_updated.emit('verify', 'pending', '')
+                self._emit_progress('verify', 'pending', '')
                 return
             
             entries_count = len(results_df)
             errors_count = results_df['Error'].ne('').sum() if 'Error' in results_df.columns else 0
             
-            self.progress_updated.emit(
+            self._emit_progress(
                 'verify', 'complete', 
                 f'✓ {entries_count} entries ({errors_count} errors)'
             )
@@ -123,26 +152,27 @@ class ExtractionWorker(QThread):
             # Collect warnings
             if errors_count > 0:
                 # Sample some errors as warnings
-                error_df = results_df[results_df['Error'] != '']
-                error_types = {}
-                for error in error_df['Error'].head(20):  # Limit to first 20
-                    for err in str(error).split(' | '):
-                        err = err.strip()
-                        if err:
-                            error_types[err] = error_types.get(err, 0) + 1
+                # Cast the sampled values once so the loop splits plain str objects
+                error_values = results_df.loc[results_df['Error'] != '', 'Error'].head(20).astype(str).to_numpy()  # Limit to first 20
+                error_types = Counter(
+                    err.strip()
+                    for error in error_values
+                    for err in error.split(' | ')
+                    if err.strip()
+                )
                 
-                for error_type, count in list(error_types.items())[:5]:  # Top 5
-                    self.warning_added.emit(f"{error_type} ({count} occurrence{'s' if count > 1 else ''})")
+                for error_type, count in error_types.most_common(5):  # Top 5
+                    self._add_warning(f"{error_type} ({count} occurrence{'s' if count > 1 else ''})")
             
             if not self._is_running:
+                self._flush_warnings()
                 return
             
             # Step 4: Export List
-            self.progress_updated.emit('export', 'loading', 'Saving results...')
+            self._emit_progress('export', 'loading', 'Saving results...')
             
             # Determine output file path
             if self.output_dir:
-                import os
                 base_output_file = os.path.join(self.output_dir, "names_output.xlsx")
             else:
                 base_output_file = "names_output.xlsx"
@@ -150,11 +180,11 @@ class ExtractionWorker(QThread):
             output_file = get_next_available_filename(base_output_file)
             
             logger.info(f"Saving results to: {output_file}")
-            save_results_to_excel(results_df, output_file, update_row_colors=update_row_colors)
+            save_results_to_excel(results_df, output_file, update_row_colors=update_row_colors, engine='xlsxwriter')
             
-            self.progress_updated.emit(
+            self._emit_progress(
                 'export', 'complete', 
-                f'✓ Saved to {output_file.split("/")[-1]}'
+                f'✓ Saved to {os.path.basename(output_file)}'
             )
             
             # Success!
@@ -162,18 +192,21 @@ class ExtractionWorker(QThread):
             if errors_count > 0:
                 success_message += f" ({errors_count} with errors)"
             
+            self._flush_warnings()
             self.finished.emit(True, success_message, output_file)
             
         except FileNotFoundError as e:
             error_msg = f"File not found: {str(e)}"
             logger.error(error_msg)
             self.error_occurred.emit(error_msg)
+            self._flush_warnings()
             self.finished.emit(False, error_msg, "")
             
         except Exception as e:
             error_msg = f"Error during processing: {str(e)}"
             logger.error(error_msg, exc_info=True)
             self.error_occurred.emit(error_msg)
+            self._flush_warnings()
             self.finished.emit(False, error_msg, "")
     
     def stop(self):
@@ -7,7 +7,11 @@ Run this file to start the graphical user interface:
 
 import sys
 import os
+import atexit
+import ctypes
 import logging
+import logging.handlers
+import multiprocessing
 
 # PyQt6 imports - installed via: pip install PyQt6
 try:
@@ -22,14 +26,24 @@ except ImportError as e:
 # Write logs to Documents folder to avoid permission issues on macOS
 documents_path = os.path.join(os.path.expanduser('~'), 'Documents')
 log_file_path = os.path.join(documents_path, 'namesgen_gui.log')
+log_format = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+# Buffer file writes: records are written in batches of 256, or immediately on WARNING and above
+file_handler = logging.FileHandler(log_file_path)
+file_handler.setFormatter(logging.Formatter(log_format))
+buffered_file_handler = logging.handlers.MemoryHandler(
+    capacity=256, flushLevel=logging.WARNING, target=file_handler
+)
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    format=log_format,
     handlers=[
-        logging.FileHandler(log_file_path),
+        buffered_file_handler,
         logging.StreamHandler()
     ]
 )
+# Write out any buffered records on exit
+atexit.register(buffered_file_handler.flush)
+atexit.register(buffered_file_handler.close)
 
 logger = logging.getLogger(__name__)
 
@@ -54,18 +68,36 @@ def main():
         import traceback
         traceback.print_exc()
     
-    # Windows-specific fixes
-    if sys.platform == 'win32':
-        # Enable high DPI scaling for Windows
+    # Import the main window up front so a broken install fails before any UI is created
+    try:
+        from gui.main_window import MainWindow
+    except Exception:
+        # ERROR level also flushes the buffered log records to namesgen_gui.log
+        logger.exception("Error importing main window")
+        import traceback
+        
+        # Show error dialog if possible (needs an application instance)
         try:
-            import ctypes
-            # Windows 8.1+
-            ctypes.windll.shcore.SetProcessDpiAwareness(1)
-        except:
-            # Windows 8 or earlier
+            app = QApplication.instance() or QApplication(sys.argv)
+            msg = QMessageBox()
+            msg.setIcon(QMessageBox.Icon.Critical)
+            msg.setWindowTitle("Startup Error")
+            msg.setText("Failed to start application")
+            msg.setDetailedText(traceback.format_exc())
+            msg.exec()
+        except Exception:
+            traceback.print_exc()
+        
+        sys.exit(1)
+    
+    # Windows-specific fixes: enable high DPI scaling (must happen before QApplication)
+    if hasattr(ctypes, 'windll'):
+        try:
+            ctypes.windll.shcore.SetProcessDpiAwareness(1)  # Windows 8.1+
+        except (AttributeError, OSError):
             try:
-                ctypes.windll.user32.SetProcessDPIAware()
-            except:
+                ctypes.windll.user32.SetProcessDPIAware()  # Windows 8 or earlier
+            except (AttributeError, OSError):
                 pass
     
     # Enable high DPI scaling
@@ -78,24 +110,11 @@ def main():
     app.setApplicationName("Name Extractor")
     app.setOrganizationName("Name Extractor")
     
-    # macOS-specific: Prevent app from quitting when last window closes
-    # This ensures the app stays running even if window is closed
-    if sys.platform == 'darwin':
-        app.setQuitOnLastWindowClosed(True)  # Keep True for normal behavior
-    
-    # Set application font (use system default if specific font not available)
-    font = app.font()
-    if sys.platform == 'win32':
-        font.setFamily("Segoe UI")
-        font.setPointSize(9)  # Set explicit font size for Windows
-    # macOS will use system default font automatically
-    app.setFont(font)
-    
-    # Create and show main window
+    # Create and show main window first so the user sees it as early as possible
     try:
-        from gui.main_window import MainWindow
         window = MainWindow()
         window.show()
+        app.processEvents()
         
         logger.info("GUI window opened")
     except Exception as e:
@@ -119,6 +138,20 @@ def main():
         
         sys.exit(1)
     
+    # macOS-specific: Prevent app from quitting when last window closes
+    # This ensures the app stays running even if window is closed
+    if sys.platform == 'darwin':
+        app.setQuitOnLastWindowClosed(True)  # Keep True for normal behavior
+    
+    # Set application font (use system default if specific font not available)
+    # Applied after the first paint; Qt propagates the change to open widgets
+    font = app.font()
+    if sys.platform == 'win32':
+        font.setFamily("Segoe UI")
+        font.setPointSize(9)  # Set explicit font size for Windows
+    # macOS will use system default font automatically
+    app.setFont(font)
+    
     # Run application
     try:
         exit_code = app.exec()
@@ -139,4 +172,6 @@ def main():
 
 
 if __name__ == "__main__":
+    # Required for the name extraction process pool in frozen (PyInstaller) builds
+    multiprocessing.freeze_support()
     main()
@@ -28,6 +28,10 @@ a = Analysis(
         'numpy.lib.format',
         'openpyxl',
         'openpyxl.cell._writer',
+        'lxml',
+        'lxml.etree',
+        'xlsxwriter',
+        'python_calamine',
         'PyQt6',
         'PyQt6.QtCore',
         'PyQt6.QtGui',
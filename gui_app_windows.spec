@@ -7,7 +7,7 @@
 # that bundles all dependencies including Python runtime.
 #
 # Prerequisites:
-#   1. Install dependencies: pip install pyinstaller PyQt6 pandas openpyxl requests unidecode
+#   1. Install dependencies: pip install pyinstaller PyQt6 pandas openpyxl lxml xlsxwriter python-calamine requests unidecode
 #   2. Make sure CT.ico exists (Windows icon) or remove icon= parameter
 #
 # Build: pyinstaller gui_app_windows.spec
@@ -157,6 +157,22 @@ a = Analysis(
         'openpyxl.writer',
         'openpyxl.writer.excel',
         
+        # ============================================================
+        # LXML (faster XML parsing/serialization for openpyxl)
+        # ============================================================
+        'lxml',
+        'lxml.etree',
+        
+        # ============================================================
+        # XLSXWRITER (formatted Excel output)
+        # ============================================================
+        'xlsxwriter',
+        
+        # ============================================================
+        # PYTHON-CALAMINE (fast Excel reading)
+        # ============================================================
+        'python_calamine',
+        
         # ============================================================
         # PYQT6 (GUI Framework)
         # ============================================================
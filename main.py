@@ -16,10 +16,12 @@ Usage:
 """
 
 import logging
+import re
 import sys
 import os
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 import requests
 
@@ -33,7 +35,7 @@ try:
         _logger.warning("NamesGen expects pandas >= 2.0 (you have %s). Some features may fail.", _pd_ver)
 except Exception:
     pass
-from processor import NameExtractionProcessor
+from processor import NameExtractionProcessor, process_in_parallel
 
 
 def get_next_available_filename(base_filename):
@@ -49,6 +51,7 @@ def get_next_available_filename(base_filename):
     Example:
         If names_output.xlsx exists -> returns names_output_1.xlsx
         If names_output_1.xlsx exists -> returns names_output_2.xlsx
+        If names_output_7.xlsx is the highest existing -> returns names_output_8.xlsx
     """
     if not os.path.exists(base_filename):
         return base_filename
@@ -59,13 +62,17 @@ def get_next_available_filename(base_filename):
     extension = base_path.suffix
     directory = base_path.parent if base_path.parent.name else Path('.')
     
-    # Find next available number
-    counter = 1
-    while True:
-        new_filename = directory / f"{name_without_ext}_{counter}{extension}"
-        if not new_filename.exists():
-            return str(new_filename)
-        counter += 1
+    # Read the directory once and take the highest existing number + 1
+    # (one scandir instead of an exists() stat per candidate)
+    numbered_pattern = re.compile(rf'^{re.escape(name_without_ext)}_(\d+){re.escape(extension)}$')
+    highest = 0
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            match = numbered_pattern.match(entry.name)
+            if match:
+                highest = max(highest, int(match.group(1)))
+    
+    return str(directory / f"{name_without_ext}_{highest + 1}{extension}")
 
 
 # Set up logging
@@ -114,7 +121,503 @@ def _is_kill_switch_active():
         return False, ""
 
 
-def save_results_to_excel(results_df, output_file, update_row_colors=None):
+# Columns merged across the rows of one booking, with their horizontal alignment
+EXCEL_MERGE_COLUMNS = [
+    ('Order Reference', 'left'), ('Travel Date', 'center'), ('Total Units', 'center'),
+    ('Tour Time', 'center'), ('Ticket Time', 'center'), ('Language', 'center'),
+    ('Tour Type', 'center'), ('Private Notes', 'left'), ('Product Code', 'left'),
+    ('Tag', 'center'), ('Change By', 'center'), ('Codice', 'center'), ('Sigilo', 'center'),
+    ('Reseller', 'left'), ('Error', 'left'), ('Notes', 'left'),
+]
+
+# Internal helper columns read for formatting but never written to the sheet
+EXCEL_INTERNAL_COLUMNS = frozenset({'_youth_converted', '_tag_options'})
+
+
+def _excel_cell_value(value):
+    """Convert a DataFrame value to a plain Python value xlsxwriter can write (None for blanks)."""
+    if isinstance(value, (list, dict)):
+        return str(value)
+    if value is None or pd.isna(value):
+        return None
+    if hasattr(value, 'item'):
+        return value.item()
+    if isinstance(value, (str, bool, int, float)):
+        return value
+    return str(value)
+
+
+def _booking_ranges(results_df):
+    """
+    Find bookings as runs of consecutive rows sharing an Order Reference.
+    
+    Args:
+        results_df: Results DataFrame in output row order
+        
+    Returns:
+        list: (order_ref, start_row, end_row) tuples with 0-based data rows;
+              rows without an Order Reference are not part of any booking
+    """
+    if 'Order Reference' not in results_df.columns or results_df.empty:
+        return []
+    
+    refs = results_df['Order Reference'].to_numpy(dtype=object)
+    missing = results_df['Order Reference'].isna().to_numpy()
+    # Run boundaries: first row, every row whose reference differs from the previous one, end
+    boundaries = np.flatnonzero(np.r_[True, refs[1:] != refs[:-1], True])
+    return [
+        (refs[start], int(start), int(end) - 1)
+        for start, end in zip(boundaries[:-1], boundaries[1:])
+        if not missing[start]
+    ]
+
+
+def _tag_labels_and_colors(options):
+    """
+    Read Tag dropdown labels and their fill colors from a booking's _tag_options.
+    
+    Returns:
+        tuple: (labels, color_map) - unique labels in order, and label -> hex color
+    """
+    labels = []
+    color_map = {}
+    if not isinstance(options, list):
+        return labels, color_map
+    for option in options:
+        label = option.get('label')
+        if not label:
+            continue
+        if label not in labels:
+            labels.append(label)
+        color = option.get('color')
+        if color:
+            color_map[label] = color
+    return labels, color_map
+
+
+def _tag_rule_groups(booking_ranges, tag_options):
+    """
+    Group bookings that share the same Tag dropdown options.
+    
+    Each distinct option set gets one dropdown and one conditional format per
+    label, applied to all of its bookings' first Tag cells at once.
+    
+    Args:
+        booking_ranges: List of (order_ref, start, end) 0-based data row ranges
+        tag_options: Per-row _tag_options values
+        
+    Returns:
+        list: (labels, color_map, row_runs) per option set; row_runs are 0-based
+              [first, last] runs of consecutive booking start rows
+    """
+    groups = {}
+    for _, start_row, _ in booking_ranges:
+        labels, color_map = _tag_labels_and_colors(tag_options[start_row])
+        if not labels:
+            continue
+        key = (tuple(labels), tuple(color_map.items()))
+        if key not in groups:
+            groups[key] = (labels, color_map, [])
+        row_runs = groups[key][2]
+        if row_runs and row_runs[-1][1] == start_row - 1:
+            row_runs[-1][1] = start_row
+        else:
+            row_runs.append([start_row, start_row])
+    return list(groups.values())
+
+
+def _sqref(col_letter, row_runs):
+    """Space-separated Excel range list for 0-based data row runs in one column."""
+    return " ".join(
+        f"{col_letter}{first + 2}" if first == last else f"{col_letter}{first + 2}:{col_letter}{last + 2}"
+        for first, last in row_runs
+    )
+
+
+def _column_width(results_df, col):
+    """Auto-fit column width: longest value or header + 2, at least 20 for ticket columns, at most 50."""
+    # Nullable string lengths run in pandas' C path
+    values = results_df[col]
+    longest_value = values.astype('string').str.len().fillna(0).max()
+    # Missing values keep the width of their str() form ('nan', 'None'), as with astype(str)
+    missing = values[values.isna()]
+    if not missing.empty:
+        longest_value = max(longest_value, max(len(str(value)) for value in missing.unique()))
+    max_length = max(int(longest_value), len(str(col))) + 2
+    if col in {'PNR', 'Codice', 'Sigilo', 'Public Notes'}:
+        max_length = max(max_length, 20)
+    return min(max_length, 50)
+
+
+def _compute_row_fills(results_df, booking_ranges, update_row_colors):
+    """
+    Compute the final fill color of every data row and of its Unit Type cell.
+    
+    Precedence (highest first): update-file row color, error row (bright yellow),
+    Unit Type hint (Child/Infant blue, Youth amber, Youth converted faded yellow;
+    Unit Type cell only), alternating booking gray.
+    
+    Args:
+        results_df: Results DataFrame in output row order
+        booking_ranges: List of (order_ref, start_row, end_row) with 0-based data rows
+        update_row_colors: Dict mapping row ID -> 6-char hex fill color
+        
+    Returns:
+        tuple: (row_fills, unit_fills) object arrays of hex colors (None = no fill)
+    """
+    n_rows = len(results_df)
+    row_fills = np.full(n_rows, None, dtype=object)
+    error_rows = np.zeros(n_rows, dtype=bool)
+    
+    if 'Error' in results_df.columns:
+        error_rows = results_df['Error'].fillna('').astype(str).str.strip().ne('').to_numpy()
+    
+    for booking_idx, (_, start_row, end_row) in enumerate(booking_ranges):
+        # Gray for the 1st, 3rd, 5th... booking
+        if booking_idx % 2 == 0:
+            row_fills[start_row:end_row + 1] = 'F0F0F0'
+        # Merged Error cells only keep the first row's text, so only that row is highlighted
+        if end_row > start_row:
+            error_rows[start_row + 1:end_row + 1] = False
+    
+    unit_fills = row_fills.copy()
+    if 'Unit Type' in results_df.columns:
+        # Compare the few distinct unit labels, then map back to rows by category code
+        unit_types = results_df['Unit Type'].astype('category')
+        unit_labels = unit_types.cat.categories.astype(str).str.strip()
+        unit_codes = unit_types.cat.codes.to_numpy()
+        unit_fills[np.isin(unit_codes, np.flatnonzero(unit_labels.isin(['Child', 'Infant'])))] = '89CFF0'
+        unit_fills[np.isin(unit_codes, np.flatnonzero(unit_labels == 'Youth'))] = 'FFBF00'
+        if '_youth_converted' in results_df.columns:
+            converted = results_df['_youth_converted']
+            # The processor emits real bools; only mixed/object columns need value matching
+            if pd.api.types.is_bool_dtype(converted):
+                youth_converted = converted.to_numpy(dtype=bool)
+            else:
+                youth_converted = converted.isin([True, 'True', 'TRUE', 1]).to_numpy()
+            unit_fills[youth_converted] = 'FFFFCC'
+    
+    row_fills[error_rows] = 'FFFF00'
+    unit_fills[error_rows] = 'FFFF00'
+    
+    if update_row_colors and 'ID' in results_df.columns:
+        ids = results_df['ID']
+        update_colors = ids.astype(str).str.strip().map(update_row_colors)
+        has_update_color = (ids.notna() & ids.ne('') & update_colors.notna()).to_numpy()
+        colored = update_colors.to_numpy()[has_update_color]
+        row_fills[has_update_color] = colored
+        unit_fills[has_update_color] = colored
+    
+    return row_fills, unit_fills
+
+
+def _save_results_with_xlsxwriter(results_df, output_file, update_row_colors, columns_to_hide):
+    """
+    Write the formatted results workbook in a single pass with xlsxwriter.
+    
+    Layout: header style, merged booking cells, update/zebra/unit/error fills,
+    Tag dropdowns, Venice Ticket Time rule, widths, hidden columns, frozen header.
+    
+    Args:
+        results_df: Results DataFrame (already filtered and reordered)
+        output_file: Output file path
+        update_row_colors: Dict mapping row ID -> 6-char hex fill color
+        columns_to_hide: Set of column names to hide in the sheet
+    """
+    import xlsxwriter
+    
+    output_cols = [col for col in results_df.columns if col not in EXCEL_INTERNAL_COLUMNS]
+    col_pos = {col: idx for idx, col in enumerate(output_cols)}
+    n_rows = len(results_df)
+    
+    workbook = xlsxwriter.Workbook(output_file, {'strings_to_formulas': False, 'strings_to_urls': False})
+    ws = workbook.add_worksheet('Sheet1')
+    
+    # One Format object per distinct (fill, alignment) pair
+    cell_formats = {}
+    
+    def get_format(fill=None, horizontal='left'):
+        key = (fill, horizontal)
+        if key not in cell_formats:
+            props = {'align': horizontal, 'valign': 'vcenter', 'shrink': True}
+            if fill:
+                props.update({'pattern': 1, 'bg_color': f'#{fill}'})
+            cell_formats[key] = workbook.add_format(props)
+        return cell_formats[key]
+    
+    # Conditional-format fills (Tag label colors) reused across all bookings
+    cf_formats = {}
+    
+    def get_cf_format(fill):
+        if fill not in cf_formats:
+            cf_formats[fill] = workbook.add_format({'pattern': 1, 'bg_color': f'#{fill}'})
+        return cf_formats[fill]
+    
+    header_format = workbook.add_format({
+        'bold': True, 'font_color': '#FFFFFF', 'font_size': 11,
+        'pattern': 1, 'bg_color': '#4472C4', 'align': 'center', 'valign': 'vcenter',
+    })
+    for col_idx, col in enumerate(output_cols):
+        ws.write(0, col_idx, col, header_format)
+    ws.set_row(0, 20)
+    # Data rows use the sheet default height instead of one row record each
+    ws.set_default_row(22)
+    
+    columns = {col: results_df[col].tolist() for col in results_df.columns}
+    booking_ranges = _booking_ranges(results_df)
+    merge_columns = [(col, align) for col, align in EXCEL_MERGE_COLUMNS if col in col_pos]
+    
+    # Row-level fills derived from the DataFrame instead of re-reading cells
+    row_fills, unit_fills = _compute_row_fills(results_df, booking_ranges, update_row_colors)
+    unit_type_idx = col_pos.get('Unit Type')
+    
+    def cell_fill(row_idx, col_idx):
+        return unit_fills[row_idx] if col_idx == unit_type_idx else row_fills[row_idx]
+    
+    # Merged booking cells (written via merge_range, skipped in the row pass)
+    merge_col_indices = {col_pos[col] for col, _ in merge_columns}
+    rows_in_merge = np.zeros(n_rows, dtype=bool)
+    for _, start_row, end_row in booking_ranges:
+        if end_row <= start_row:
+            continue
+        rows_in_merge[start_row:end_row + 1] = True
+        for col, alignment in merge_columns:
+            col_idx = col_pos[col]
+            ws.merge_range(start_row + 1, col_idx, end_row + 1, col_idx,
+                           _excel_cell_value(columns[col][start_row]),
+                           get_format(cell_fill(start_row, col_idx), alignment))
+    
+    for row_idx in range(n_rows):
+        in_merge = rows_in_merge[row_idx]
+        for col_idx, col in enumerate(output_cols):
+            if in_merge and col_idx in merge_col_indices:
+                continue
+            ws.write(row_idx + 1, col_idx, _excel_cell_value(columns[col][row_idx]),
+                     get_format(cell_fill(row_idx, col_idx)))
+    
+    # Tag dropdowns and per-label conditional colors on each booking's first Tag cell,
+    # one dropdown and one rule per label for all bookings sharing an option set
+    tag_idx = col_pos.get('Tag')
+    if tag_idx is not None and '_tag_options' in columns:
+        tag_letter = xlsxwriter.utility.xl_col_to_name(tag_idx)
+        for labels, color_map, row_runs in _tag_rule_groups(booking_ranges, columns['_tag_options']):
+            first_row = row_runs[0][0] + 1
+            multi_range = _sqref(tag_letter, row_runs)
+            
+            joined = ",".join(label.replace('"', '""') for label in labels)
+            ws.data_validation(first_row, tag_idx, first_row, tag_idx, {
+                'validate': 'list', 'source': f'"{joined}"', 'ignore_blank': True,
+                'show_input': False, 'show_error': False, 'multi_range': multi_range,
+            })
+            # Relative reference: Excel shifts it to each cell in the range
+            cell_address = f"{tag_letter}{first_row + 1}"
+            for label, color in color_map.items():
+                ws.conditional_format(first_row, tag_idx, first_row, tag_idx, {
+                    'type': 'formula', 'criteria': f'{cell_address}="{label}"',
+                    'format': get_cf_format(color), 'multi_range': multi_range,
+                })
+    
+    # Venice: faded yellow Ticket Time when it differs from Tour Time
+    ticket_time_idx = col_pos.get('Ticket Time')
+    tour_time_idx = col_pos.get('Tour Time')
+    if ticket_time_idx is not None and tour_time_idx is not None and n_rows:
+        faded_yellow_ticket = get_cf_format('FFFFCC')
+        ticket_letter = xlsxwriter.utility.xl_col_to_name(ticket_time_idx)
+        tour_letter = xlsxwriter.utility.xl_col_to_name(tour_time_idx)
+        # One rule for the whole column; the relative row follows each cell
+        ws.conditional_format(1, ticket_time_idx, n_rows, ticket_time_idx, {
+            'type': 'formula', 'criteria': f'${ticket_letter}2<>${tour_letter}2',
+            'format': faded_yellow_ticket,
+        })
+    
+    # Column widths and hidden columns
+    hidden_cols = []
+    for col_idx, col in enumerate(output_cols):
+        options = {}
+        if col in columns_to_hide:
+            options['hidden'] = True
+            hidden_cols.append(col)
+        ws.set_column(col_idx, col_idx, _column_width(results_df, col), None, options)
+    if hidden_cols:
+        logger.info("Hidden columns in Excel: %s", hidden_cols)
+    
+    ws.freeze_panes(1, 0)
+    workbook.close()
+
+
+def _save_results_with_openpyxl(results_df, output_file, update_row_colors, columns_to_hide):
+    """
+    Write the formatted results workbook in a single pass with openpyxl's write-only mode.
+    
+    Same layout as _save_results_with_xlsxwriter. Column and row settings are
+    applied before each row is streamed; merges, Tag dropdowns and conditional
+    formats are written with the sheet tail, so the file is never re-loaded.
+    
+    Args:
+        results_df: Results DataFrame (already filtered and reordered)
+        output_file: Output file path
+        update_row_colors: Dict mapping row ID -> 6-char hex fill color
+        columns_to_hide: Set of column names to hide in the sheet
+    """
+    from copy import copy
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import PatternFill, Alignment, Font
+    from openpyxl.utils import get_column_letter
+    from openpyxl.worksheet.cell_range import CellRange, MultiCellRange
+    from openpyxl.worksheet.datavalidation import DataValidation
+    from openpyxl.formatting.rule import FormulaRule
+    
+    output_cols = [col for col in results_df.columns if col not in EXCEL_INTERNAL_COLUMNS]
+    col_pos = {col: idx for idx, col in enumerate(output_cols)}
+    col_letters = [get_column_letter(col_idx) for col_idx in range(1, len(output_cols) + 1)]
+    n_rows = len(results_df)
+    
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet('Sheet1')
+    
+    # Column widths, hidden columns and frozen header must be set before any row is written
+    hidden_cols = []
+    for col_idx, col in enumerate(output_cols):
+        dimension = ws.column_dimensions[col_letters[col_idx]]
+        dimension.width = _column_width(results_df, col)
+        if col in columns_to_hide:
+            dimension.hidden = True
+            hidden_cols.append(col)
+    if hidden_cols:
+        logger.info("Hidden columns in Excel: %s", hidden_cols)
+    ws.freeze_panes = 'A2'
+    
+    # Style objects shared by every cell that uses them
+    fill_cache = {}
+    alignment_cache = {}
+    
+    def get_fill(hex_color):
+        if hex_color not in fill_cache:
+            fill_cache[hex_color] = PatternFill(start_color=hex_color, end_color=hex_color, fill_type="solid")
+        return fill_cache[hex_color]
+    
+    def get_alignment(horizontal):
+        if horizontal not in alignment_cache:
+            alignment_cache[horizontal] = Alignment(
+                horizontal=horizontal, vertical='center', wrap_text=False, shrink_to_fit=True
+            )
+        return alignment_cache[horizontal]
+    
+    # Pre-generated cell styles: openpyxl registers a fill/alignment in the workbook's style
+    # tables (hash + equality checks) on every assignment, so each distinct (fill, alignment)
+    # pair is registered once on a template cell and its style array copied into data cells
+    cell_styles = {}
+    
+    def get_cell_style(fill, horizontal):
+        key = (fill, horizontal)
+        if key not in cell_styles:
+            template = WriteOnlyCell(ws)
+            template.alignment = get_alignment(horizontal)
+            if fill:
+                template.fill = get_fill(fill)
+            cell_styles[key] = template._style
+        return cell_styles[key]
+    
+    header_fill = get_fill("4472C4")
+    header_font = Font(bold=True, color="FFFFFF", size=11)
+    header_alignment = Alignment(horizontal='center', vertical='center')
+    header_cells = []
+    for col in output_cols:
+        cell = WriteOnlyCell(ws, value=col)
+        cell.fill = header_fill
+        cell.font = header_font
+        cell.alignment = header_alignment
+        header_cells.append(cell)
+    ws.row_dimensions[1].height = 20
+    # Data rows use the sheet default height instead of one row dimension each
+    ws.sheet_format.defaultRowHeight = 22
+    ws.sheet_format.customHeight = True
+    ws.append(header_cells)
+    
+    columns = {col: results_df[col].tolist() for col in results_df.columns}
+    booking_ranges = _booking_ranges(results_df)
+    merge_columns = [(col, align) for col, align in EXCEL_MERGE_COLUMNS if col in col_pos]
+    row_fills, unit_fills = _compute_row_fills(results_df, booking_ranges, update_row_colors)
+    unit_type_idx = col_pos.get('Unit Type')
+    
+    # Merged booking cells: value and style on the first row only.
+    # Every row of a multi-row booking shares one per-column alignment list.
+    plain_alignments = ['left'] * len(output_cols)
+    merged_alignments = list(plain_alignments)
+    for col, alignment in merge_columns:
+        merged_alignments[col_pos[col]] = alignment
+    merge_col_indices = {col_pos[col] for col, _ in merge_columns}
+    rows_in_merge = np.zeros(n_rows, dtype=bool)
+    merge_follow_rows = np.zeros(n_rows, dtype=bool)
+    merge_ranges = []
+    for _, start_row, end_row in booking_ranges:
+        if end_row <= start_row:
+            continue
+        rows_in_merge[start_row:end_row + 1] = True
+        merge_follow_rows[start_row + 1:end_row + 1] = True
+        for col, _ in merge_columns:
+            col_idx = col_pos[col]
+            merge_ranges.append(CellRange(min_col=col_idx + 1, min_row=start_row + 2,
+                                          max_col=col_idx + 1, max_row=end_row + 2))
+    # Booking ranges never overlap, so register them in one go (merged_cells.add
+    # scans every existing range per call, which is quadratic in the number of merges)
+    ws.merged_cells = MultiCellRange(merge_ranges)
+    
+    for row_idx in range(n_rows):
+        alignments = merged_alignments if rows_in_merge[row_idx] else plain_alignments
+        is_follow_row = merge_follow_rows[row_idx]
+        row_cells = []
+        for col_idx, col in enumerate(output_cols):
+            # Excel renders a merged range from its top-left cell, so the cells
+            # below it are left out entirely
+            if is_follow_row and col_idx in merge_col_indices:
+                row_cells.append(None)
+                continue
+            cell = WriteOnlyCell(ws, value=_excel_cell_value(columns[col][row_idx]))
+            fill = unit_fills[row_idx] if col_idx == unit_type_idx else row_fills[row_idx]
+            cell._style = copy(get_cell_style(fill, alignments[col_idx]))
+            row_cells.append(cell)
+        ws.append(row_cells)
+    
+    # Tag dropdowns and per-label conditional colors on each booking's first Tag cell,
+    # one dropdown and one rule per label for all bookings sharing an option set
+    tag_idx = col_pos.get('Tag')
+    if tag_idx is not None and '_tag_options' in columns:
+        for labels, color_map, row_runs in _tag_rule_groups(booking_ranges, columns['_tag_options']):
+            sqref = _sqref(col_letters[tag_idx], row_runs)
+            
+            joined = ",".join(label.replace('"', '""') for label in labels)
+            ws.data_validations.append(
+                DataValidation(type="list", formula1=f'"{joined}"', allow_blank=True, sqref=sqref)
+            )
+            
+            # Relative reference: Excel shifts it to each cell in the range
+            cell_address = f"{col_letters[tag_idx]}{row_runs[0][0] + 2}"
+            for label, color in color_map.items():
+                formula = f'{cell_address}="{label}"'
+                ws.conditional_formatting.add(
+                    sqref, FormulaRule(formula=[formula], fill=get_fill(color), stopIfTrue=False)
+                )
+    
+    # Venice: faded yellow Ticket Time when it differs from Tour Time
+    ticket_time_idx = col_pos.get('Ticket Time')
+    tour_time_idx = col_pos.get('Tour Time')
+    if ticket_time_idx is not None and tour_time_idx is not None and n_rows:
+        faded_yellow_ticket = get_fill("FFFFCC")
+        ticket_letter = col_letters[ticket_time_idx]
+        tour_letter = col_letters[tour_time_idx]
+        # One rule for the whole column; the relative row follows each cell
+        formula = f'${ticket_letter}2<>${tour_letter}2'
+        ws.conditional_formatting.add(
+            f"{ticket_letter}2:{ticket_letter}{n_rows + 1}",
+            FormulaRule(formula=[formula], fill=faded_yellow_ticket, stopIfTrue=False)
+        )
+    
+    wb.save(output_file)
+
+
+def save_results_to_excel(results_df, output_file, update_row_colors=None, engine='xlsxwriter'):
     """
     Save results to Excel with formatting.
     
@@ -131,19 +634,20 @@ def save_results_to_excel(results_df, output_file, update_row_colors=None):
         results_df: Results DataFrame
         output_file: Output file path
         update_row_colors: Optional dict mapping row ID -> 6-char hex fill color (from update file)
+        engine: 'xlsxwriter' (default; falls back to openpyxl when xlsxwriter is not
+            installed) or 'openpyxl' (write-only mode); both write the formatted file in one pass
     """
     if update_row_colors is None:
         update_row_colors = {}
-    from openpyxl import load_workbook
-    from openpyxl.styles import PatternFill, Alignment, Font
-    from openpyxl.worksheet.datavalidation import DataValidation
-    from openpyxl.formatting.rule import FormulaRule
+    if engine == 'xlsxwriter':
+        try:
+            import xlsxwriter  # noqa: F401
+        except ImportError:
+            logger.warning("xlsxwriter not installed - using openpyxl for Excel output")
+            engine = 'openpyxl'
     
     logger.info("Creating formatted Excel output...")
     
-    # Check if _youth_converted column exists
-    has_youth_converted = '_youth_converted' in results_df.columns
-    
     # Tag column: hide only when any product has "colosseo" in Product Tags
     hide_tag_column = bool(results_df.get('_has_colosseo_tag', pd.Series(dtype=bool)).fillna(False).any())
     
@@ -157,17 +661,18 @@ def save_results_to_excel(results_df, output_file, update_row_colors=None):
     
     # Remove columns that are completely empty (all NaN or empty strings)
     # But keep ID, _from_update, Tag, Notes (always show), Ticket Time (Venice), and Colosseum columns we want to hide (not remove)
-    columns_to_never_remove = list(dict.fromkeys(
+    columns_to_never_remove = frozenset(
         columns_always_hide + ['Tag', 'Notes', 'Ticket Time'] + (colosseum_only_hide + ['PNR', 'TIX NOM'] if has_colosseum_columns else [])
-    ))
+    )
     columns_to_check = [col for col in results_df.columns 
                         if not col.startswith('_') and col not in columns_to_never_remove]
     empty_columns = []
-    for col in columns_to_check:
-        # Check if column is empty (all NaN, None, or empty strings)
-        col_values = results_df[col].fillna('')
-        if col_values.astype(str).str.strip().eq('').all():
-            empty_columns.append(col)
+    if columns_to_check:
+        # A column is empty when every value is NaN, None, or blank after stripping;
+        # checked for all columns in one numpy pass
+        values = results_df[columns_to_check].fillna('').astype(str).to_numpy(dtype=str)
+        empty_mask = (np.char.strip(values) == '').all(axis=0)
+        empty_columns = [col for col, is_empty in zip(columns_to_check, empty_mask) if is_empty]
     
     if empty_columns:
         logger.info(f"Removing empty columns from output: {empty_columns}")
@@ -185,9 +690,11 @@ def save_results_to_excel(results_df, output_file, update_row_colors=None):
     
     # Reorder columns: put known columns first in order, then any remaining columns
     existing_cols = list(results_df.columns)
-    ordered_cols = [col for col in desired_column_order if col in existing_cols]
+    existing_set = set(existing_cols)
+    ordered_cols = [col for col in desired_column_order if col in existing_set]
     # Add any remaining columns that aren't in the desired order (including internal _columns)
-    remaining_cols = [col for col in existing_cols if col not in ordered_cols]
+    ordered_set = set(ordered_cols)
+    remaining_cols = [col for col in existing_cols if col not in ordered_set]
     final_column_order = ordered_cols + remaining_cols
     results_df = results_df[final_column_order]
     
@@ -196,342 +703,18 @@ def save_results_to_excel(results_df, output_file, update_row_colors=None):
         if internal_col in results_df.columns:
             results_df = results_df.drop(columns=[internal_col])
     
-    # Save basic Excel (including _youth_converted for now)
-    results_df.to_excel(output_file, index=False)
-    
-    # Load workbook for formatting
-    wb = load_workbook(output_file)
-    ws = wb.active
+    # Hide columns: always ID and _from_update; Tag when any product has colosseo; Colosseum-specific when applicable
+    columns_to_hide = frozenset(columns_always_hide + (colosseum_only_hide if has_colosseum_columns else []))
     
+    writer = _save_results_with_xlsxwriter if engine == 'xlsxwriter' else _save_results_with_openpyxl
     try:
-        # Find column indices
-        header_row = ws[1]
-        col_indices = {}
-        for idx, cell in enumerate(header_row, 1):
-            if cell.value:
-                col_indices[cell.value] = idx
-        
-        travel_date_col = col_indices.get('Travel Date')
-        order_ref_col = col_indices.get('Order Reference')
-        total_units_col = col_indices.get('Total Units')
-        error_col = col_indices.get('Error')
-        notes_col = col_indices.get('Notes')
-        tour_time_col = col_indices.get('Tour Time')
-        ticket_time_col = col_indices.get('Ticket Time')
-        language_col = col_indices.get('Language')
-        tour_type_col = col_indices.get('Tour Type')
-        private_notes_col = col_indices.get('Private Notes')
-        product_code_col = col_indices.get('Product Code')
-        change_by_col = col_indices.get('Change By')
-        codice_col = col_indices.get('Codice')
-        sigilo_col = col_indices.get('Sigilo')
-        reseller_col = col_indices.get('Reseller')
-        
-        # Format header row
-        header_fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
-        header_font = Font(bold=True, color="FFFFFF", size=11)
-        header_alignment = Alignment(horizontal='center', vertical='center')
-        
-        for cell in header_row:
-            if cell.value:  # Only format cells with content
-                cell.fill = header_fill
-                cell.font = header_font
-                cell.alignment = header_alignment
-        
-        logger.info("Applied header formatting: blue background, white bold text")
-        
-        # Merge cells by Order Reference (group consecutive rows)
-        # Also track booking ranges for zebra coloring
-        booking_ranges = []  # List of (order_ref, start_row, end_row) tuples
-        
-        if order_ref_col:
-            current_order_ref = None
-            start_row = None
-            
-            for row_idx in range(2, ws.max_row + 2):  # +2 to include last group
-                if row_idx <= ws.max_row:
-                    cell_value = ws.cell(row=row_idx, column=order_ref_col).value
-                else:
-                    cell_value = None  # Force processing of last group
-                
-                if cell_value != current_order_ref:
-                    # Process previous group
-                    if current_order_ref is not None and start_row is not None:
-                        end_row = row_idx - 1
-                        
-                        # Store booking range for zebra coloring
-                        booking_ranges.append((current_order_ref, start_row, end_row))
-                        
-                        if end_row > start_row:  # Multiple rows in group
-                            # Merge Order Reference
-                            ws.merge_cells(start_row=start_row, start_column=order_ref_col,
-                                         end_row=end_row, end_column=order_ref_col)
-                            ws.cell(row=start_row, column=order_ref_col).alignment = Alignment(
-                                horizontal='left', vertical='center', wrap_text=False, shrink_to_fit=True)
-                            
-                            # Merge other shared columns
-                            cols_to_merge = [
-                                (travel_date_col, 'center'),
-                                (total_units_col, 'center'),
-                                (tour_time_col, 'center'),
-                                (ticket_time_col, 'center'),
-                                (language_col, 'center'),
-                                (tour_type_col, 'center'),
-                                (private_notes_col, 'left'),
-                                (product_code_col, 'left'),
-                                (col_indices.get('Tag'), 'center'),
-                                (change_by_col, 'center'),
-                                (codice_col, 'center'),
-                                (sigilo_col, 'center'),
-                                (reseller_col, 'left'),
-                                (error_col, 'left'),
-                                (notes_col, 'left')
-                            ]
-                            
-                            for col_idx, alignment in cols_to_merge:
-                                if col_idx:
-                                    ws.merge_cells(start_row=start_row, start_column=col_idx,
-                                                 end_row=end_row, end_column=col_idx)
-                                    ws.cell(row=start_row, column=col_idx).alignment = Alignment(
-                                        horizontal=alignment, vertical='center', wrap_text=False, shrink_to_fit=True)
-                    
-                    # Start new group
-                    if row_idx <= ws.max_row:
-                        current_order_ref = cell_value
-                        start_row = row_idx
-        
-        # Fixed row height and alignment so rows don't expand and long text shrinks to fit
-        data_row_height = 22
-        merged_top_left = set()  # (row, col) of top-left cell of each merged range
-        for (_, start_row, end_row) in booking_ranges:
-            if end_row > start_row:
-                if order_ref_col:
-                    merged_top_left.add((start_row, order_ref_col))
-                for col_idx, _ in [
-                    (travel_date_col, 'center'), (total_units_col, 'center'), (tour_time_col, 'center'),
-                    (ticket_time_col, 'center'),
-                    (language_col, 'center'), (tour_type_col, 'center'), (private_notes_col, 'left'),
-                    (product_code_col, 'left'), (col_indices.get('Tag'), 'center'), (change_by_col, 'center'),
-                    (codice_col, 'center'), (sigilo_col, 'center'), (reseller_col, 'left'), (error_col, 'left'),
-                    (notes_col, 'left')
-                ]:
-                    if col_idx:
-                        merged_top_left.add((start_row, col_idx))
-        for row_idx in range(2, ws.max_row + 1):
-            ws.row_dimensions[row_idx].height = data_row_height
-            for col_idx in range(1, ws.max_column + 1):
-                if (row_idx, col_idx) not in merged_top_left:
-                    cell = ws.cell(row=row_idx, column=col_idx)
-                    cell.alignment = Alignment(
-                        horizontal='left', vertical='center', wrap_text=False, shrink_to_fit=True
-                    )
-        
-        # Apply preserved row colors from update file first (before alternating colors)
-        id_col_idx = col_indices.get('ID')
-        rows_with_update_color = set()
-        if update_row_colors and id_col_idx is not None and 'ID' in results_df.columns:
-            for row_idx in range(2, ws.max_row + 1):
-                df_idx = row_idx - 2
-                if df_idx < 0 or df_idx >= len(results_df):
-                    continue
-                id_val = results_df.iloc[df_idx].get('ID')
-                if pd.isna(id_val) or id_val == '':
-                    continue
-                id_key = str(id_val).strip()
-                hex_color = update_row_colors.get(id_key)
-                if hex_color:
-                    rows_with_update_color.add(row_idx)
-                    row_fill = PatternFill(start_color=hex_color, end_color=hex_color, fill_type="solid")
-                    for col_idx in range(1, ws.max_column + 1):
-                        ws.cell(row=row_idx, column=col_idx).fill = row_fill
-        
-        # Apply alternating booking colors (gray for odd bookings, white for even)
-        # Skip rows that have update-file colors so we don't overwrite them
-        gray_fill = PatternFill(start_color="F0F0F0", end_color="F0F0F0", fill_type="solid")
-        
-        for booking_idx, (_, start_row, end_row) in enumerate(booking_ranges):
-            # Alternate color: gray for odd bookings (0, 2, 4...), white for even (1, 3, 5...)
-            if booking_idx % 2 == 0:  # Even index = odd booking number (1st, 3rd, 5th...)
-                # Apply gray to all rows in this booking that don't have update-file color
-                for row_idx in range(start_row, end_row + 1):
-                    if row_idx in rows_with_update_color:
-                        continue
-                    for col_idx in range(1, len(results_df.columns) + 1):
-                        cell = ws.cell(row=row_idx, column=col_idx)
-                        try:
-                            no_fill = (getattr(cell.fill, 'fill_type', None) is None or
-                                       (getattr(cell.fill.start_color, 'index', None) == '00000000'))
-                        except Exception:
-                            no_fill = True
-                        if no_fill:
-                            cell.fill = gray_fill
-        
-        # Unit Type cell coloring only (Child/Infant/Youth). Full-row coloring is reserved for errors below.
-        unit_type_col = col_indices.get('Unit Type')
-        if unit_type_col:
-            light_blue_fill = PatternFill(start_color="89CFF0", end_color="89CFF0", fill_type="solid")
-            yellow_fill_youth = PatternFill(start_color="FFBF00", end_color="FFBF00", fill_type="solid")
-            for row_idx in range(2, ws.max_row + 1):
-                if row_idx in rows_with_update_color:
-                    continue
-                unit_type_cell = ws.cell(row=row_idx, column=unit_type_col)
-                unit_value = str(unit_type_cell.value).strip() if unit_type_cell.value else ''
-                if unit_value in ['Child', 'Infant']:
-                    unit_type_cell.fill = light_blue_fill
-                elif unit_value == 'Youth':
-                    unit_type_cell.fill = yellow_fill_youth
-
-        # Youth converted to Adult (non-EU): highlight Unit Type cell only (cell-level hint), not the whole row.
-        if has_youth_converted:
-            youth_converted_col = col_indices.get('_youth_converted')
-            if youth_converted_col and unit_type_col:
-                faded_yellow_fill = PatternFill(start_color="FFFFCC", end_color="FFFFCC", fill_type="solid")
-                for row_idx in range(2, ws.max_row + 1):
-                    if row_idx in rows_with_update_color:
-                        continue
-                    converted_cell = ws.cell(row=row_idx, column=youth_converted_col)
-                    if converted_cell.value in [True, 'True', 'TRUE', 1]:
-                        ws.cell(row=row_idx, column=unit_type_col).fill = faded_yellow_fill
-
-        # Error rows: full-row bright yellow (row-level state; overrides any cell-level fills above).
-        if error_col:
-            yellow_fill = PatternFill(start_color="FFFF00", end_color="FFFF00", fill_type="solid")
-            for row_idx in range(2, ws.max_row + 1):
-                if row_idx in rows_with_update_color:
-                    continue
-                error_cell = ws.cell(row=row_idx, column=error_col)
-                if error_cell.value and str(error_cell.value).strip():
-                    for col_idx in range(1, len(results_df.columns) + 1):
-                        ws.cell(row=row_idx, column=col_idx).fill = yellow_fill
-        
-        # Apply Tag dropdowns and conditional coloring per booking
-        tag_col = col_indices.get('Tag')
-        has_tag_options_column = '_tag_options' in results_df.columns
-        if tag_col and has_tag_options_column and booking_ranges:
-            tag_column_letter = ws.cell(row=1, column=tag_col).column_letter
-            
-            for order_ref, start_row, _ in booking_ranges:
-                df_idx = start_row - 2  # account for header row
-                if df_idx < 0 or df_idx >= len(results_df):
-                    continue
-                
-                options = results_df.iloc[df_idx].get('_tag_options', [])
-                if not isinstance(options, list) or not options:
-                    continue
-                
-                labels = []
-                color_map = {}
-                for option in options:
-                    label = option.get('label')
-                    if not label:
-                        continue
-                    if label not in labels:
-                        labels.append(label)
-                    color = option.get('color')
-                    if color:
-                        color_map[label] = color
-                
-                if not labels:
-                    continue
-                
-                sanitized = [label.replace('"', '""') for label in labels]
-                joined = ",".join(sanitized)
-                dv = DataValidation(type="list", formula1=f'"{joined}"', allow_blank=True)
-                ws.add_data_validation(dv)
-                
-                cell_address = f"{tag_column_letter}{start_row}"
-                tag_cell = ws[cell_address]
-                dv.add(tag_cell)
-                
-                # Apply conditional formatting per label on the merged tag cell
-                for label, color in color_map.items():
-                    if not color:
-                        continue
-                    fill = PatternFill(start_color=color, end_color=color, fill_type="solid")
-                    formula = f'{cell_address}="{label}"'
-                    ws.conditional_formatting.add(cell_address, FormulaRule(formula=[formula], fill=fill, stopIfTrue=False))
-        
-        # Venice: Conditional formatting on Ticket Time (faded yellow when it differs from Tour Time)
-        if ticket_time_col and tour_time_col:
-            faded_yellow_ticket = PatternFill(start_color="FFFFCC", end_color="FFFFCC", fill_type="solid")
-            ticket_col_letter = ws.cell(row=1, column=ticket_time_col).column_letter
-            tour_col_letter = ws.cell(row=1, column=tour_time_col).column_letter
-            for row_idx in range(2, ws.max_row + 1):
-                cell_ref = f"${ticket_col_letter}${row_idx}"
-                tour_ref = f"${tour_col_letter}${row_idx}"
-                formula = f'{cell_ref}<>{tour_ref}'
-                ws.conditional_formatting.add(
-                    f"{ticket_col_letter}{row_idx}",
-                    FormulaRule(formula=[formula], fill=faded_yellow_ticket, stopIfTrue=False)
-                )
-        
-        # Remove _youth_converted column if it exists (internal flag, not for user)
-        if has_youth_converted:
-            youth_converted_col = col_indices.get('_youth_converted')
-            if youth_converted_col:
-                ws.delete_cols(youth_converted_col)
-                logger.info("Removed internal _youth_converted column from Excel output")
-        
-        # Remove internal _tag_options column if present
-        if has_tag_options_column:
-            tag_options_col = None
-            for idx, cell in enumerate(ws[1], 1):
-                if cell.value == '_tag_options':
-                    tag_options_col = idx
-                    break
-            if tag_options_col:
-                ws.delete_cols(tag_options_col)
-                logger.info("Removed internal _tag_options column from Excel output")
-        
-        # Auto-adjust column widths (after removing _youth_converted)
-        for col_idx, col in enumerate(results_df.columns, 1):
-            # Skip internal columns
-            if col in ['_youth_converted', '_tag_options']:
-                continue
-            max_length = max(
-                results_df[col].astype(str).apply(len).max(),
-                len(str(col))
-            ) + 2
-            
-            # Set minimum width of 20 for PNR, Codice, Sigilo columns
-            if col in ['PNR', 'Codice', 'Sigilo','Public Notes']:
-                max_length = max(max_length, 20)
-            
-            col_letter = ws.cell(row=1, column=col_idx).column_letter
-            ws.column_dimensions[col_letter].width = min(max_length, 50)
-        
-        # Header row height (data row heights set earlier with fixed height + shrink-to-fit)
-        ws.row_dimensions[1].height = 20
-        
-        # Hide columns: always ID and _from_update; Tag when any product has colosseo; Colosseum-specific when applicable
-        columns_to_hide = list(columns_always_hide)
-        if has_colosseum_columns:
-            columns_to_hide = columns_to_hide + colosseum_only_hide
-        hidden_cols = []
-        for col_name in columns_to_hide:
-            if col_name in col_indices:
-                col_idx = col_indices[col_name]
-                col_letter = ws.cell(row=1, column=col_idx).column_letter
-                ws.column_dimensions[col_letter].hidden = True
-                hidden_cols.append(col_name)
-        if hidden_cols:
-            logger.info(f"Hidden columns in Excel: {hidden_cols}")
-        
-        # Freeze header row (keep it visible when scrolling)
-        ws.freeze_panes = 'A2'  # Freeze first row (header)
-        logger.info("Applied freeze panes: header row will stay visible when scrolling")
-        
-        # Save formatted workbook
-        wb.save(output_file)
+        writer(results_df, output_file, update_row_colors, columns_to_hide)
         logger.info("Applied Excel formatting: merged cells, colors, auto-widths, freeze panes")
-        
     except Exception as e:
         logger.warning(f"Could not apply Excel formatting: {e}")
+        internal_cols = [col for col in results_df.columns if col in EXCEL_INTERNAL_COLUMNS]
+        results_df.drop(columns=internal_cols).to_excel(output_file, index=False)
         logger.info("Basic Excel file saved without formatting")
-    finally:
-        # Remove internal helper column from the DataFrame so callers don't see it
-        if '_tag_options' in results_df.columns:
-            results_df.drop(columns=['_tag_options'], inplace=True)
 
 
 def main():
@@ -585,6 +768,7 @@ def main():
         if update_file and os.path.exists(update_file):
             logger.info("Update file provided - will reuse previously extracted names")
             update_df, update_row_colors = load_update_file(update_file)
+            update_df = NameExtractionProcessor.select_update_columns(update_df)
         else:
             logger.info("No Update file - extracting all names from scratch")
         
@@ -602,8 +786,7 @@ def main():
         logger.info("STEP 3: Extracting Names and Validating Data")
         logger.info("=" * 80)
         
-        processor = NameExtractionProcessor(merged_df, monday_df, update_df)
-        results_df = processor.process()
+        results_df = process_in_parallel(merged_df, monday_df, update_df)
         
         # Step 4: Display results
         logger.info("\n" + "=" * 80)
@@ -630,15 +813,18 @@ def main():
                 logger.info("\nError breakdown:")
                 logger.info("-" * 80)
                 error_df = results_df[results_df['Error'] != '']
-                # Count unique error types
-                error_types = {}
-                for error in error_df['Error']:
-                    for err in str(error).split(' | '):
-                        err = err.strip()
-                        if err:
-                            error_types[err] = error_types.get(err, 0) + 1
+                # Count unique error types (most frequent first)
+                error_types = (
+                    error_df['Error'].astype('string')
+                    .str.split(' | ', regex=False)
+                    .explode()
+                    .str.strip()
+                    .replace('', pd.NA)
+                    .dropna()
+                    .value_counts()
+                )
                 
-                for error_type, count in sorted(error_types.items(), key=lambda x: -x[1]):
+                for error_type, count in error_types.items():
                     logger.info(f"  {error_type}: {count}")
             
             # Save to Excel with formatting (auto-increment filename if exists)
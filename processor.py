@@ -14,16 +14,19 @@ Orchestrates the complete name extraction workflow:
 
 import pandas as pd
 import logging
+import multiprocessing
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from collections import Counter
 
-from config import GYG_MDA_PLATFORM, GYG_STANDARD_PLATFORMS, ALL_GYG_PLATFORMS
+from config import GYG_MDA_PLATFORM, GYG_STANDARD_PLATFORMS, ALL_GYG_PLATFORMS, PARALLEL_MIN_BOOKINGS
 from utils.normalization import (
-    normalize_ref, normalize_time, normalize_travel_date,
+    normalize_ref, normalize_ref_series, normalize_time, normalize_travel_date,
     extract_language_from_product_code,
     extract_tour_type_from_product_code,
-    standardize_column_names,
-    get_column_value
+    standardize_column_names
 )
 from utils.age_calculator import categorize_age, convert_infant_to_child_for_colosseum
 from utils.tix_nom_generator import generate_tix_nom
@@ -46,13 +49,49 @@ from validators import (
 
 logger = logging.getLogger(__name__)
 
+# Any GYG platform name (standard or MDA), matched anywhere in the reseller
+GYG_RESELLER_PATTERN = re.compile(r'GetYourGuide|Get your Guide')
+
+# Booking data fields read from each Ventrata row, with the column names tried in order
+BOOKING_DATA_FIELDS = {
+    'first_name': ('ticket customer first name', 'first name'),
+    'last_name': ('ticket customer last name', 'last name'),
+    'customer': ('customer',),
+    'product_code': ('product code',),
+    'product_tags': ('product tags',),
+    'unit': ('unit',),
+}
+
 
 class NameExtractionProcessor:
     """
     Main processor for name extraction from Ventrata/Monday data.
     """
     
-    def __init__(self, ventrata_df, monday_df=None, update_df=None):
+    # Update file columns read by the processor (lowercase, matched case-insensitively)
+    UPDATE_FILE_COLUMNS = [
+        'id', 'order reference', 'travel date', 'full name', 'unit type', 'private notes',
+        'tag', 'notes', 'change by', 'pnr', 'ticket group', 'codice', 'sigilo',
+        '_normalized_order_ref'
+    ]
+    
+    @classmethod
+    def select_update_columns(cls, update_df):
+        """
+        Project an update file DataFrame to the columns the processor reads.
+        
+        Row index and order are unchanged, so ID-keyed row colors still apply.
+        
+        Args:
+            update_df: Update file DataFrame (from load_update_file)
+            
+        Returns:
+            pd.DataFrame: update_df restricted to UPDATE_FILE_COLUMNS
+        """
+        keep = [col for col in update_df.columns if str(col).lower() in cls.UPDATE_FILE_COLUMNS]
+        return update_df[keep]
+    
+    def __init__(self, ventrata_df, monday_df=None, update_df=None, validate_travel_dates=True):
         """
         Initialize processor with data.
         
@@ -60,6 +99,8 @@ class NameExtractionProcessor:
             ventrata_df: Ventrata DataFrame (required)
             monday_df: Monday DataFrame (optional)
             update_df: Update file DataFrame (optional) - previously extracted data
+            validate_travel_dates: Check Ventrata/update travel dates overlap (disabled for
+                shards of an already-validated input, see process_in_parallel)
         """
         self.ventrata_df = ventrata_df
         self.monday_df = monday_df
@@ -74,30 +115,65 @@ class NameExtractionProcessor:
         
         # Create column mappings
         self.ventrata_col_map = standardize_column_names(ventrata_df)
+        # Column behind each booking data field, resolved once instead of per row
+        self.booking_data_columns = {
+            field: next((self.ventrata_col_map[name] for name in names if self.ventrata_col_map.get(name)), None)
+            for field, names in BOOKING_DATA_FIELDS.items()
+        }
+        # Row positions per normalized order reference, so each booking's rows
+        # are looked up instead of re-scanning the whole DataFrame
+        self.ventrata_ref_positions = ventrata_df.groupby('_normalized_order_ref', sort=False).indices
+        # Unit type counts per booking from one grouped count (same as get_unit_counts
+        # on the booking's rows: missing units are not counted)
+        self.ventrata_unit_counts = {}
+        unit_col = self.ventrata_col_map.get('unit')
+        if unit_col:
+            unit_sizes = ventrata_df.groupby(['_normalized_order_ref', unit_col], sort=False).size()
+            for (ref, unit), count in unit_sizes.items():
+                self.ventrata_unit_counts.setdefault(ref, {})[unit] = count
+        # Each distinct Travel Date string parsed once; bookings then carry the Timestamp
+        self.parsed_travel_dates = self._parse_travel_date_values(ventrata_df)
         if monday_df is not None:
             self.monday_col_map = standardize_column_names(monday_df)
+            # Monday columns copied into the output, resolved once instead of per booking.
+            # PNR: try 'ticket pnr' / 'Ticket PNR', then any column containing 'pnr'
+            self.monday_pnr_col = (
+                self.monday_col_map.get('ticket pnr')
+                or self.monday_col_map.get('Ticket PNR')
+                or next((col for col in monday_df.columns if 'pnr' in str(col).lower()), None)
+            )
+            self.monday_ticket_group_col = self.monday_col_map.get('ticket group')
         else:
             self.monday_col_map = {}
+            self.monday_pnr_col = None
+            self.monday_ticket_group_col = None
         
         if update_df is not None:
             self.update_col_map = standardize_column_names(update_df)
             # Create ID-to-row mapping for quick lookup
             self._build_update_id_mapping()
+            if '_normalized_order_ref' in update_df.columns:
+                self.update_ref_positions = update_df.groupby('_normalized_order_ref', sort=False).indices
+            else:
+                self.update_ref_positions = {}
             # Validate travel dates match between Ventrata and Update file
-            self._validate_travel_dates()
+            if validate_travel_dates:
+                self._validate_travel_dates(ventrata_df, update_df, self.ventrata_col_map, self.update_col_map)
         else:
             self.update_col_map = {}
             self.update_id_map = {}
+            self.update_ref_positions = {}
         
         # Track bookings that require unit check
         self.bookings_require_unit_check = set()
         
         # Determine processing scenario
         self.scenario = determine_scenario(ventrata_df, monday_df)
-        logger.info(f"Processing scenario: {self.scenario.value}")
+        self.include_monday_columns = should_include_monday_columns(self.scenario)
+        logger.info("Processing scenario: %s", self.scenario.value)
         
         if update_df is not None:
-            logger.info(f"Update file provided with {len(update_df)} rows and {len(self.update_id_map)} unique IDs")
+            logger.info("Update file provided with %d rows and %d unique IDs", len(update_df), len(self.update_id_map))
     
     def process(self):
         """
@@ -126,10 +202,10 @@ class NameExtractionProcessor:
         
         # Step 1: Determine processing order
         if self.monday_df is not None:
-            logger.info(f"Processing in Monday order ({len(self.monday_df)} entries)")
+            logger.info("Processing in Monday order (%d entries)", len(self.monday_df))
             data_to_process = self._get_monday_ordered_data()
         else:
-            logger.info(f"Processing in Ventrata order ({len(self.ventrata_df)} unique bookings)")
+            logger.info("Processing in Ventrata order (%d unique bookings)", len(self.ventrata_df))
             data_to_process = self._get_ventrata_ordered_data()
         
         # Step 2: Process each booking
@@ -149,7 +225,7 @@ class NameExtractionProcessor:
             results.extend(booking_results)
         
         # Step 3: Create results DataFrame
-        logger.info(f"Creating results DataFrame with {len(results)} entries")
+        logger.info("Creating results DataFrame with %d entries", len(results))
         results_df = pd.DataFrame(results)
         
         if results_df.empty:
@@ -170,18 +246,19 @@ class NameExtractionProcessor:
                         missing_cols.append(col)
                 if missing_cols:
                     logger.warning(
-                        f"Colosseum rows have missing values for columns {missing_cols}. "
-                        "Check Ventrata tour time or product code mappings."
+                        "Colosseum rows have missing values for columns %s. "
+                        "Check Ventrata tour time or product code mappings.",
+                        missing_cols
                     )
         
         # Step 4: Apply post-processing validations
         results_df = self._apply_post_processing(results_df)
         
-        logger.info(f"Name extraction complete: {len(results_df)} entries processed")
+        logger.info("Name extraction complete: %d entries processed", len(results_df))
         
         return results_df
     
-    def _calculate_gyg_booking_errors(self, travelers, ventrata_rows, platform, travel_date):
+    def _calculate_gyg_booking_errors(self, travelers, ventrata_rows, platform, travel_date, unit_counts=None):
         """
         Calculate booking-level errors from already-extracted travelers.
         
@@ -193,6 +270,7 @@ class NameExtractionProcessor:
             ventrata_rows: DataFrame with Ventrata rows for this booking
             platform: Platform name ('GYG Standard' or 'GYG MDA')
             travel_date: Travel date for age calculations
+            unit_counts: Unit type counts of ventrata_rows, if already computed
             
         Returns:
             list: List of error strings
@@ -207,9 +285,10 @@ class NameExtractionProcessor:
             return errors
         
         # Get unit counts
-        unit_counts = get_unit_counts(ventrata_rows, unit_col)
-        child_unit_count = sum(unit_counts.get(unit, 0) for unit in ['Child', 'Infant'])
-        adult_unit_count = sum(unit_counts.get(unit, 0) for unit in ['Adult', 'Youth'])
+        if unit_counts is None:
+            unit_counts = get_unit_counts(ventrata_rows, unit_col)
+        child_unit_count = unit_counts.get('Child', 0) + unit_counts.get('Infant', 0)
+        adult_unit_count = unit_counts.get('Adult', 0) + unit_counts.get('Youth', 0)
         total_units = child_unit_count + adult_unit_count
         
         has_mixed_units = child_unit_count > 0 and adult_unit_count > 0
@@ -256,23 +335,25 @@ class NameExtractionProcessor:
             logger.error("No order reference column in Monday data")
             return []
         
-        data = []
-        seen_refs = set()
-        for _, row in self.monday_df.iterrows():
-            order_ref = row[order_ref_col]
-            if pd.isna(order_ref):
-                continue
-            
-            # Normalize order reference to avoid duplicates
-            norm_ref = normalize_ref(order_ref)
-            if norm_ref in seen_refs:
-                continue
-            seen_refs.add(norm_ref)
-            
-            data.append((order_ref, {'monday_row': row}))
-            logger.debug(f"Added Monday row for order {order_ref}")
+        refs = self.monday_df[order_ref_col]
+        has_ref = refs.notna()
+        # Normalize order references to avoid duplicates (the loader already stores them)
+        if '_normalized_order_ref' in self.monday_df.columns:
+            norm_refs = self.monday_df['_normalized_order_ref']
+        else:
+            norm_refs = normalize_ref_series(refs)
+        
+        # Keep the first row of each normalized reference, in file order
+        first_rows = has_ref.to_numpy().copy()
+        first_rows[first_rows] = ~norm_refs[has_ref].duplicated().to_numpy()
         
-        logger.info(f"Prepared {len(data)} bookings from Monday file")
+        # Plain dicts per row: iterrows would box every row into a Series
+        data = [
+            (row[order_ref_col], {'monday_row': row})
+            for row in self.monday_df[first_rows].to_dict('records')
+        ]
+        
+        logger.info("Prepared %d bookings from Monday file", len(data))
         return data
     
     def _get_ventrata_ordered_data(self):
@@ -282,17 +363,36 @@ class NameExtractionProcessor:
             logger.error("No order reference column in Ventrata data")
             return []
         
-        seen_refs = set()
-        ordered_refs = []
+        refs = self.ventrata_df[order_ref_col]
+        ordered_refs = refs[refs.notna()].drop_duplicates()
         
-        for _, row in self.ventrata_df.iterrows():
-            ref = row[order_ref_col]
-            if pd.isna(ref) or ref in seen_refs:
-                continue
-            seen_refs.add(ref)
-            ordered_refs.append(ref)
+        return [(ref, {}) for ref in ordered_refs.tolist()]
+    
+    def _get_monday_columns(self, monday_row):
+        """
+        Get the Monday-specific output columns for a booking.
+        
+        Args:
+            monday_row: The booking's Monday row
+            
+        Returns:
+            dict: PNR, Ticket Group and TIX NOM values ('' when missing)
+        """
+        pnr_value = ''
+        if self.monday_pnr_col and self.monday_pnr_col in monday_row:
+            value = monday_row[self.monday_pnr_col]
+            pnr_value = value if not pd.isna(value) else ''
+        
+        ticket_group_value = ''
+        if self.monday_ticket_group_col and self.monday_ticket_group_col in monday_row:
+            value = monday_row[self.monday_ticket_group_col]
+            ticket_group_value = value if not pd.isna(value) else ''
         
-        return [(ref, {}) for ref in ordered_refs]
+        return {
+            'PNR': pnr_value,
+            'Ticket Group': ticket_group_value,
+            'TIX NOM': generate_tix_nom(pnr_value) if pnr_value else '',
+        }
     
     def _process_booking(self, order_ref, norm_ref, booking_data):
         """
@@ -310,12 +410,10 @@ class NameExtractionProcessor:
             list: List of result dicts (one per traveler)
         """
         # Get all Ventrata rows for this booking
-        ventrata_rows = self.ventrata_df[
-            self.ventrata_df['_normalized_order_ref'] == norm_ref
-        ]
+        ventrata_rows = self.ventrata_df.iloc[self.ventrata_ref_positions.get(norm_ref, [])]
         
         if ventrata_rows.empty:
-            logger.warning(f"No Ventrata data found for order {order_ref}")
+            logger.warning("No Ventrata data found for order %s", order_ref)
             return [{
                 'Full Name': '',
                 'ID': '',
@@ -333,7 +431,10 @@ class NameExtractionProcessor:
             return self._process_with_update_file(order_ref, norm_ref, ventrata_rows, booking_data)
         
         # No update file: process normally
-        return self._process_booking_normal(order_ref, norm_ref, ventrata_rows, booking_data)
+        return self._process_booking_normal(
+            order_ref, norm_ref, ventrata_rows, booking_data,
+            unit_counts=self.ventrata_unit_counts.get(norm_ref, {})
+        )
     
     def _identify_extractor_type(self, reseller):
         """
@@ -355,14 +456,20 @@ class NameExtractionProcessor:
         
         # Check if it's ANY GYG platform (including MDA)
         # We'll use fallback logic: try GYG Standard first, then GYG MDA
-        if any(gyg in reseller_str for gyg in ['GetYourGuide', 'Get your Guide']):
+        if GYG_RESELLER_PATTERN.search(reseller_str):
             return 'gyg_standard'  # This triggers the fallback logic
         
         # Default to non-GYG
         return 'non_gyg'
     
     def _build_update_id_mapping(self):
-        """Build a mapping from Ventrata ID to update file row for quick lookup."""
+        """
+        Build a mapping from Ventrata ID to update file row position for quick lookup.
+        
+        Uses a hashed key -> value dict (set_index().to_dict()) instead of
+        materializing a row Series per ID; rows are only built on demand
+        via _get_update_row(). Later rows win for repeated IDs.
+        """
         self.update_id_map = {}
         
         if self.update_df is None:
@@ -373,60 +480,71 @@ class NameExtractionProcessor:
             logger.warning("Update file missing ID column, cannot build ID mapping")
             return
         
-        for idx, row in self.update_df.iterrows():
-            ventrata_id = row[id_col]
-            if pd.notna(ventrata_id) and ventrata_id != '':
-                self.update_id_map[ventrata_id] = row
+        ids = self.update_df[id_col]
+        valid_ids = ids.notna() & (ids != '')
+        positions = pd.DataFrame({'_id': ids.values, '_pos': range(len(self.update_df))})
+        self.update_id_map = positions[valid_ids.values].set_index('_id')['_pos'].to_dict()
         
-        logger.debug(f"Built update ID mapping with {len(self.update_id_map)} entries")
+        logger.debug("Built update ID mapping with %d entries", len(self.update_id_map))
     
-    def _validate_travel_dates(self):
+    def _get_update_row(self, ventrata_id):
+        """Return the update file row (Series) for a Ventrata ID present in update_id_map."""
+        return self.update_df.iloc[self.update_id_map[ventrata_id]]
+    
+    @staticmethod
+    def _validate_travel_dates(ventrata_df, update_df, ventrata_col_map, update_col_map):
         """
         Validate that travel dates in Ventrata and Update file match.
         
         This ensures the user doesn't accidentally use an update file from a different
         date with a new Ventrata file. Both files must have the same travel date(s).
         
+        Args:
+            ventrata_df: Ventrata DataFrame
+            update_df: Update file DataFrame (optional)
+            ventrata_col_map: Column mapping of ventrata_df
+            update_col_map: Column mapping of update_df
+        
         Raises:
             ValueError: If travel dates don't match between Ventrata and Update file
         """
-        if self.update_df is None:
+        if update_df is None:
             return
         
         # Get travel date column from Ventrata
-        ventrata_travel_date_col = self.ventrata_col_map.get('travel date')
+        ventrata_travel_date_col = ventrata_col_map.get('travel date')
         if not ventrata_travel_date_col:
             # Try prefixed version (when merged with Monday)
-            ventrata_travel_date_col = self.ventrata_col_map.get('ventrata_travel date')
+            ventrata_travel_date_col = ventrata_col_map.get('ventrata_travel date')
         
-        if not ventrata_travel_date_col or ventrata_travel_date_col not in self.ventrata_df.columns:
+        if not ventrata_travel_date_col or ventrata_travel_date_col not in ventrata_df.columns:
             logger.warning("Ventrata file missing Travel Date column, skipping date validation")
             return
         
         # Get travel date column from Update file
-        update_travel_date_col = self.update_col_map.get('travel date')
-        if not update_travel_date_col or update_travel_date_col not in self.update_df.columns:
+        update_travel_date_col = update_col_map.get('travel date')
+        if not update_travel_date_col or update_travel_date_col not in update_df.columns:
             logger.warning("Update file missing Travel Date column, skipping date validation")
             return
         
         # Get unique normalized travel dates from Ventrata
         ventrata_dates = set()
-        for date_val in self.ventrata_df[ventrata_travel_date_col].dropna().unique():
+        for date_val in ventrata_df[ventrata_travel_date_col].dropna().unique():
             normalized = normalize_travel_date(date_val)
-            logger.debug(f"Ventrata date: '{date_val}' (type: {type(date_val).__name__}) -> normalized: '{normalized}'")
+            logger.debug("Ventrata date: '%s' (type: %s) -> normalized: '%s'", date_val, type(date_val).__name__, normalized)
             if normalized:
                 ventrata_dates.add(normalized)
         
         # Get unique normalized travel dates from Update file
         update_dates = set()
-        for date_val in self.update_df[update_travel_date_col].dropna().unique():
+        for date_val in update_df[update_travel_date_col].dropna().unique():
             normalized = normalize_travel_date(date_val)
-            logger.debug(f"Update date: '{date_val}' (type: {type(date_val).__name__}) -> normalized: '{normalized}'")
+            logger.debug("Update date: '%s' (type: %s) -> normalized: '%s'", date_val, type(date_val).__name__, normalized)
             if normalized:
                 update_dates.add(normalized)
         
-        logger.info(f"Ventrata travel dates: {sorted(ventrata_dates)}")
-        logger.info(f"Update file travel dates: {sorted(update_dates)}")
+        logger.info("Ventrata travel dates: %s", sorted(ventrata_dates))
+        logger.info("Update file travel dates: %s", sorted(update_dates))
         
         # Check if there's any overlap
         if not ventrata_dates:
@@ -451,7 +569,33 @@ class NameExtractionProcessor:
             logger.error(error_msg)
             raise ValueError(error_msg)
         
-        logger.info(f"Travel date validation passed. Common dates: {sorted(common_dates)}")
+        logger.info("Travel date validation passed. Common dates: %s", sorted(common_dates))
+    
+    def _parse_travel_date_values(self, ventrata_df):
+        """
+        Parse each distinct Travel Date string in the Ventrata data once.
+        
+        Args:
+            ventrata_df: Ventrata DataFrame
+            
+        Returns:
+            dict: Travel Date string -> pd.Timestamp (unparseable strings are left out)
+        """
+        parsed_dates = {}
+        for key in ('travel date', 'ventrata_travel date'):
+            col = self.ventrata_col_map.get(key)
+            if not col or col not in ventrata_df.columns:
+                continue
+            for value in ventrata_df[col].dropna().unique():
+                if not isinstance(value, str) or value in parsed_dates:
+                    continue
+                try:
+                    parsed = pd.to_datetime(value)
+                except (ValueError, TypeError, OverflowError):
+                    continue
+                if not pd.isna(parsed):
+                    parsed_dates[value] = parsed
+        return parsed_dates
     
     def _extract_travel_date(self, ventrata_row, monday_row=None, order_ref='Unknown'):
         """
@@ -461,12 +605,13 @@ class NameExtractionProcessor:
         This method handles both scenarios (merged and non-merged).
         
         Args:
-            ventrata_row: Ventrata DataFrame row
+            ventrata_row: Ventrata DataFrame row (Series or record dict)
             monday_row: Optional Monday DataFrame row (not used, kept for backward compatibility)
             order_ref: Order reference for logging
             
         Returns:
-            Travel Date value (datetime, string, or None)
+            Travel Date value (datetime, string, or None); strings that parse as
+            dates are returned as the Timestamp parsed in __init__
         """
         travel_date = None
         
@@ -475,25 +620,25 @@ class NameExtractionProcessor:
         
         # Option 1: Try unprefixed 'travel date' (Ventrata-only scenario)
         ventrata_col = self.ventrata_col_map.get('travel date')
-        if ventrata_col and ventrata_col in ventrata_row.index:
+        if ventrata_col and ventrata_col in ventrata_row:
             travel_date_val = ventrata_row[ventrata_col]
             if not pd.isna(travel_date_val):
-                travel_date = travel_date_val
-                logger.debug(f"Travel Date for {order_ref} extracted from Ventrata (unprefixed): {travel_date}")
+                travel_date = self.parsed_travel_dates.get(travel_date_val, travel_date_val)
+                logger.debug("Travel Date for %s extracted from Ventrata (unprefixed): %s", order_ref, travel_date)
                 return travel_date
         
         # Option 2: Try prefixed 'ventrata_travel date' (Ventrata+Monday merged scenario)
         ventrata_prefixed_col = self.ventrata_col_map.get('ventrata_travel date')
-        if ventrata_prefixed_col and ventrata_prefixed_col in ventrata_row.index:
+        if ventrata_prefixed_col and ventrata_prefixed_col in ventrata_row:
             travel_date_val = ventrata_row[ventrata_prefixed_col]
             if not pd.isna(travel_date_val):
-                travel_date = travel_date_val
-                logger.debug(f"Travel Date for {order_ref} extracted from Ventrata (prefixed): {travel_date}")
+                travel_date = self.parsed_travel_dates.get(travel_date_val, travel_date_val)
+                logger.debug("Travel Date for %s extracted from Ventrata (prefixed): %s", order_ref, travel_date)
                 return travel_date
         
         # Not found in either format
-        logger.warning(f"Travel Date not found for {order_ref} in Ventrata data. "
-                      f"Checked columns: {ventrata_col}, {ventrata_prefixed_col}")
+        logger.warning("Travel Date not found for %s in Ventrata data. "
+                       "Checked columns: %s, %s", order_ref, ventrata_col, ventrata_prefixed_col)
         
         return travel_date
     
@@ -520,32 +665,30 @@ class NameExtractionProcessor:
             else:
                 return str(travel_date)
         except Exception as e:
-            logger.warning(f"Error formatting travel date {travel_date}: {e}")
+            logger.warning("Error formatting travel date %s: %s", travel_date, e)
             return str(travel_date) if travel_date else ''
     
-    def _build_booking_data_dict(self, row, monday_row=None):
+    def _build_booking_data_dict(self, row, monday_row=None, order_ref='building_data_dict'):
         """
         Build booking data dict from a Ventrata row.
         
         Args:
-            row: Ventrata DataFrame row
+            row: Ventrata DataFrame row (Series or record dict)
             monday_row: Optional Monday DataFrame row (not used for travel_date, kept for future use)
+            order_ref: Order reference for logging
             
         Returns:
             dict: Booking data including travel_date from Ventrata only
         """
         # Extract travel_date from Ventrata only (handles both merged and non-merged scenarios)
-        travel_date = self._extract_travel_date(row, monday_row=None, order_ref='building_data_dict')
+        travel_date = self._extract_travel_date(row, monday_row=None, order_ref=order_ref)
         
-        return {
-            'first_name': get_column_value(row, self.ventrata_col_map, 'ticket customer first name', 'first name'),
-            'last_name': get_column_value(row, self.ventrata_col_map, 'ticket customer last name', 'last name'),
-            'customer': get_column_value(row, self.ventrata_col_map, 'customer'),
-            'travel_date': travel_date,
-            'product_code': get_column_value(row, self.ventrata_col_map, 'product code'),
-            'product_tags': get_column_value(row, self.ventrata_col_map, 'product tags'),
-            'unit': get_column_value(row, self.ventrata_col_map, 'unit'),
+        booking_data = {
+            field: row.get(col) if col else None
+            for field, col in self.booking_data_columns.items()
         }
+        booking_data['travel_date'] = travel_date
+        return booking_data
 
     @staticmethod
     def _is_colosseum_product(product_tags):
@@ -604,147 +747,159 @@ class NameExtractionProcessor:
         # Check if EU country
         is_eu = is_eu_country(customer_country)
         
+        # Child/Infant labels only depend on the product tags, so resolve them once per
+        # booking (Infant lazily, as its conversion is logged)
+        child_label = convert_infant_to_child_for_colosseum('Child', product_tags)
+        infant_label = None
+        
         # Initialize all travelers as unassigned
         for traveler in sorted_travelers:
             traveler['unit_type'] = None
             traveler['original_unit_type'] = None  # For ID matching before conversions
             traveler['youth_converted_to_adult'] = False  # Flag for coloring
         
+        # Travelers assigned by each step
+        child_assigned = 0
+        youth_assigned = 0
+        adult_assigned = 0
+        
         # Step 1: Assign Child/Infant units (only if Child units exist in booking)
         if child_units > 0:
-            child_assigned = 0
             infant_assigned = 0
             for traveler in sorted_travelers:
+                if child_assigned >= child_units:
+                    break  # All Child/Infant units assigned
                 age = traveler.get('age')
                 # Only assign Child/Infant to travelers under 18
-                if age is not None and age < 18 and child_assigned < child_units:
+                if age is not None and age < 18:
                     if infant_assigned < infant_units:
-                        base_unit = 'Infant'
+                        # Store original unit type for ID matching (BEFORE conversion)
+                        traveler['original_unit_type'] = 'Infant'
+                        # Check if should be converted from Infant based on monument
+                        if infant_label is None:
+                            infant_label = convert_infant_to_child_for_colosseum('Infant', product_tags)
+                        traveler['unit_type'] = infant_label
                         infant_assigned += 1
                     else:
-                        base_unit = 'Child'
-                    # Store original unit type for ID matching (BEFORE conversion)
-                    traveler['original_unit_type'] = base_unit
-                    # Check if should be converted from Infant based on monument
-                    traveler['unit_type'] = convert_infant_to_child_for_colosseum(base_unit, product_tags)
+                        traveler['original_unit_type'] = 'Child'
+                        traveler['unit_type'] = child_label
                     child_assigned += 1
         
         # Step 2: Assign Youth units (only if Youth units exist in booking)
         if youth_units > 0:
-            youth_assigned = 0
-            
             for traveler in sorted_travelers:
-                if traveler.get('unit_type') is not None:
+                if youth_assigned >= youth_units:
+                    break  # All Youth units assigned
+                if traveler['unit_type'] is not None:
                     continue  # Already assigned
                 
                 age = traveler.get('age')
+                name = traveler.get('name')
                 
                 # Rule 1: Non-GYG bookings
                 # - EU countries: Keep Youth as booked
                 # - Non-EU countries: Convert Youth based on age (same as GYG non-EU)
                 if not is_gyg:
-                    if youth_assigned < youth_units:
-                        traveler['original_unit_type'] = 'Youth'  # Store original for ID matching
-                        
-                        if is_eu:
-                            # EU: Keep Youth as-is
-                            traveler['unit_type'] = 'Youth'
+                    traveler['original_unit_type'] = 'Youth'  # Store original for ID matching
+                    
+                    if is_eu:
+                        # EU: Keep Youth as-is
+                        traveler['unit_type'] = 'Youth'
+                        youth_assigned += 1
+                        logger.debug("Non-GYG EU: Keeping Youth unit for %s", name)
+                    else:
+                        # Non-EU: Convert based on age (same logic as GYG non-EU)
+                        if age is not None and age < 18:
+                            traveler['unit_type'] = child_label
+                            traveler['youth_converted_to_adult'] = True  # Flag for coloring
                             youth_assigned += 1
-                            logger.debug(f"Non-GYG EU: Keeping Youth unit for {traveler.get('name')}")
+                            logger.info("Non-GYG non-EU: Converting Youth to Child for %s, age %s (country: %s)", name, age, customer_country)
                         else:
-                            # Non-EU: Convert based on age (same logic as GYG non-EU)
-                            if age is not None and age < 18:
-                                base_unit = 'Child'
-                                traveler['unit_type'] = convert_infant_to_child_for_colosseum(base_unit, product_tags)
-                                traveler['youth_converted_to_adult'] = True  # Flag for coloring
-                                youth_assigned += 1
-                                logger.info(f"Non-GYG non-EU: Converting Youth to Child for {traveler.get('name')}, age {age} (country: {customer_country})")
-                            else:
-                                # Age >= 18 or age unknown
-                                traveler['unit_type'] = 'Adult'
-                                traveler['youth_converted_to_adult'] = True  # Flag for coloring
-                                youth_assigned += 1
-                                logger.info(f"Non-GYG non-EU: Converting Youth to Adult for {traveler.get('name')}, age {age} (country: {customer_country})")
+                            # Age >= 18 or age unknown
+                            traveler['unit_type'] = 'Adult'
+                            traveler['youth_converted_to_adult'] = True  # Flag for coloring
+                            youth_assigned += 1
+                            logger.info("Non-GYG non-EU: Converting Youth to Adult for %s, age %s (country: %s)", name, age, customer_country)
                 
                 # Rule 2: GYG EU bookings - Keep Youth as booked (preserve unit type)
                 # Validation will flag errors if age is outside 18-24 range
                 elif is_gyg and is_eu:
-                    if youth_assigned < youth_units:
-                        traveler['original_unit_type'] = 'Youth'  # Store original for ID matching
-                        traveler['unit_type'] = 'Youth'
-                        youth_assigned += 1
-                        if age is not None and 18 <= age < 25:
-                            logger.debug(f"GYG EU: Assigning Youth for {traveler.get('name')}, age {age} (valid range)")
-                        else:
-                            logger.debug(f"GYG EU: Keeping Youth for {traveler.get('name')}, age {age} (outside range, will flag error)")
+                    traveler['original_unit_type'] = 'Youth'  # Store original for ID matching
+                    traveler['unit_type'] = 'Youth'
+                    youth_assigned += 1
+                    if age is not None and 18 <= age < 25:
+                        logger.debug("GYG EU: Assigning Youth for %s, age %s (valid range)", name, age)
+                    else:
+                        logger.debug("GYG EU: Keeping Youth for %s, age %s (outside range, will flag error)", name, age)
                 
                 # Rule 3: GYG non-EU bookings - Convert Youth based on age (mark for coloring)
                 # If age < 18: Convert to Child
                 # If age >= 18: Convert to Adult
                 elif is_gyg and not is_eu:
-                    if youth_assigned < youth_units:
-                        # Store original unit type as Youth BEFORE conversion
-                        traveler['original_unit_type'] = 'Youth'
-                        
-                        # Convert based on age
-                        if age is not None and age < 18:
-                            base_unit = 'Child'
-                            traveler['unit_type'] = convert_infant_to_child_for_colosseum(base_unit, product_tags)
-                            traveler['youth_converted_to_adult'] = True  # Flag for coloring (reusing for any conversion)
-                            youth_assigned += 1
-                            logger.info(f"GYG non-EU: Converting Youth to Child for {traveler.get('name')}, age {age} (country: {customer_country})")
-                        else:
-                            # Age >= 18 or age unknown
-                            traveler['unit_type'] = 'Adult'
-                            traveler['youth_converted_to_adult'] = True  # Flag for coloring
-                            youth_assigned += 1
-                            logger.info(f"GYG non-EU: Converting Youth to Adult for {traveler.get('name')}, age {age} (country: {customer_country})")
+                    # Store original unit type as Youth BEFORE conversion
+                    traveler['original_unit_type'] = 'Youth'
+                    
+                    # Convert based on age
+                    if age is not None and age < 18:
+                        traveler['unit_type'] = child_label
+                        traveler['youth_converted_to_adult'] = True  # Flag for coloring (reusing for any conversion)
+                        youth_assigned += 1
+                        logger.info("GYG non-EU: Converting Youth to Child for %s, age %s (country: %s)", name, age, customer_country)
+                    else:
+                        # Age >= 18 or age unknown
+                        traveler['unit_type'] = 'Adult'
+                        traveler['youth_converted_to_adult'] = True  # Flag for coloring
+                        youth_assigned += 1
+                        logger.info("GYG non-EU: Converting Youth to Adult for %s, age %s (country: %s)", name, age, customer_country)
         
         # Step 3: Assign Adult units (only if Adult units exist in booking)
         if adult_units > 0:
-            adult_assigned = 0
             for traveler in sorted_travelers:
+                if adult_assigned >= adult_units:
+                    break  # All Adult units assigned
                 # Assign Adult to remaining unassigned travelers
-                if traveler.get('unit_type') is None and adult_assigned < adult_units:
+                if traveler['unit_type'] is None:
                     traveler['original_unit_type'] = 'Adult'  # Store original for ID matching
                     traveler['unit_type'] = 'Adult'
                     adult_assigned += 1
         
         # Warning for any unassigned travelers (likely due to missing age data or unit count mismatch)
-        for traveler in sorted_travelers:
-            if traveler.get('unit_type') is None:
-                age = traveler.get('age')
-                name = traveler.get('name', 'Unknown')
-                if age is None:
-                    # No age data - can't determine unit type, assign based on available units
-                    logger.warning(f"No age data for {name}, cannot determine unit type from age")
-                    # Assign based on what units are available, prioritizing Adult
-                    if adult_units > 0:
-                        traveler['original_unit_type'] = 'Adult'
-                        traveler['unit_type'] = 'Adult'
-                    elif child_units > 0:
-                        traveler['original_unit_type'] = 'Child'
-                        traveler['unit_type'] = 'Child'
-                    elif youth_units > 0:
-                        traveler['original_unit_type'] = 'Youth'
-                        traveler['unit_type'] = 'Youth'
-                    else:
-                        # No units available at all - default to Adult
-                        traveler['original_unit_type'] = 'Adult'
-                        traveler['unit_type'] = 'Adult'
-                else:
-                    # Has age but wasn't assigned - unit count mismatch
-                    logger.warning(f"Unit type not assigned for {name} (age {age:.1f}) - unit count mismatch")
-                    # Assign based on age as fallback
-                    if age < 18:
-                        traveler['original_unit_type'] = 'Child'
-                        traveler['unit_type'] = 'Child'
-                    elif 18 <= age < 25:
-                        traveler['original_unit_type'] = 'Youth'
-                        traveler['unit_type'] = 'Youth'
+        # Only needed when the steps above left someone unassigned
+        if child_assigned + youth_assigned + adult_assigned < len(sorted_travelers):
+            for traveler in sorted_travelers:
+                if traveler.get('unit_type') is None:
+                    age = traveler.get('age')
+                    name = traveler.get('name', 'Unknown')
+                    if age is None:
+                        # No age data - can't determine unit type, assign based on available units
+                        logger.warning("No age data for %s, cannot determine unit type from age", name)
+                        # Assign based on what units are available, prioritizing Adult
+                        if adult_units > 0:
+                            traveler['original_unit_type'] = 'Adult'
+                            traveler['unit_type'] = 'Adult'
+                        elif child_units > 0:
+                            traveler['original_unit_type'] = 'Child'
+                            traveler['unit_type'] = 'Child'
+                        elif youth_units > 0:
+                            traveler['original_unit_type'] = 'Youth'
+                            traveler['unit_type'] = 'Youth'
+                        else:
+                            # No units available at all - default to Adult
+                            traveler['original_unit_type'] = 'Adult'
+                            traveler['unit_type'] = 'Adult'
                     else:
-                        traveler['original_unit_type'] = 'Adult'
-                        traveler['unit_type'] = 'Adult'
+                        # Has age but wasn't assigned - unit count mismatch
+                        logger.warning("Unit type not assigned for %s (age %.1f) - unit count mismatch", name, age)
+                        # Assign based on age as fallback
+                        if age < 18:
+                            traveler['original_unit_type'] = 'Child'
+                            traveler['unit_type'] = 'Child'
+                        elif 18 <= age < 25:
+                            traveler['original_unit_type'] = 'Youth'
+                            traveler['unit_type'] = 'Youth'
+                        else:
+                            traveler['original_unit_type'] = 'Adult'
+                            traveler['unit_type'] = 'Adult'
         
         return sorted_travelers
     
@@ -824,8 +979,8 @@ class NameExtractionProcessor:
             # Special rule: If booked as Adult, keep as Adult (don't convert to Child/Youth)
             if original_booked and original_booked.lower() == 'adult':
                 final_type = 'Adult'
-                logger.debug(f"Smart Match: Keeping {traveler.get('name', 'Unknown')} as Adult "
-                           f"(booked as Adult, age={traveler.get('age')}, ideal={ideal_type})")
+                logger.debug("Smart Match: Keeping %s as Adult (booked as Adult, age=%s, ideal=%s)",
+                             traveler.get('name', 'Unknown'), traveler.get('age'), ideal_type)
             else:
                 # Determine final unit type based on age (ideal_type), not matched slot
                 if ideal_type:
@@ -839,8 +994,8 @@ class NameExtractionProcessor:
                 final_type = 'Adult'
                 # Set youth converted flag for light yellow coloring
                 traveler['youth_converted_to_adult'] = True
-                logger.info(f"Smart Match: Non-EU Youth conversion for {traveler.get('name', 'Unknown')} "
-                           f"(age={traveler.get('age')}, country={customer_country}) -> {final_type}")
+                logger.info("Smart Match: Non-EU Youth conversion for %s (age=%s, country=%s) -> %s",
+                            traveler.get('name', 'Unknown'), traveler.get('age'), customer_country, final_type)
             
             # Apply Infant->Child conversion for Colosseum if needed
             if final_type == 'Infant':
@@ -855,8 +1010,8 @@ class NameExtractionProcessor:
             
             # Log any corrections (except when keeping Adult as Adult)
             if original_booked and (original_booked.lower() != final_type.lower()):
-                logger.info(f"Smart Match: Corrected {traveler.get('name', 'Unknown')} from "
-                           f"{original_booked} to {final_type} (age={traveler.get('age')})")
+                logger.info("Smart Match: Corrected %s from %s to %s (age=%s)",
+                            traveler.get('name', 'Unknown'), original_booked, final_type, traveler.get('age'))
             
             # Clean up temporary fields
             traveler.pop('_ideal_unit_type', None)
@@ -929,7 +1084,7 @@ class NameExtractionProcessor:
                         break
             
             if not matched:
-                logger.debug(f"No traveler found for unit type {unit_type} in {order_ref}")
+                logger.debug("No traveler found for unit type %s in %s", unit_type, order_ref)
         
         # Assign empty IDs to any unmatched travelers
         for unit_type, travelers_list in unit_to_travelers.items():
@@ -937,7 +1092,7 @@ class NameExtractionProcessor:
                 if 'ventrata_id' not in traveler:
                     traveler['ventrata_id'] = ''
         
-        logger.debug(f"Mapped {len(travelers)} GYG travelers to IDs for {order_ref}")
+        logger.debug("Mapped %d GYG travelers to IDs for %s", len(travelers), order_ref)
         
         return travelers
     
@@ -963,7 +1118,7 @@ class NameExtractionProcessor:
         """
         id_col = self.ventrata_col_map.get('id')
         if not id_col or id_col not in ventrata_rows.columns:
-            logger.warning(f"No ID column in Ventrata for {order_ref}, falling back to normal extraction")
+            logger.warning("No ID column in Ventrata for %s, falling back to normal extraction", order_ref)
             return self._process_booking_normal(order_ref, norm_ref, ventrata_rows, booking_data)
         
         # Get all IDs from Ventrata for this booking
@@ -974,7 +1129,7 @@ class NameExtractionProcessor:
                 ventrata_ids.append(v_id)
         
         if not ventrata_ids:
-            logger.warning(f"No valid IDs found in Ventrata for {order_ref}")
+            logger.warning("No valid IDs found in Ventrata for %s", order_ref)
             return self._process_booking_normal(order_ref, norm_ref, ventrata_rows, booking_data)
         
         # Split IDs into existing (in update file) and new
@@ -986,7 +1141,7 @@ class NameExtractionProcessor:
             else:
                 new_ids.append(v_id)
         
-        logger.debug(f"{order_ref}: {len(existing_ids)} existing IDs, {len(new_ids)} new IDs")
+        logger.debug("%s: %d existing IDs, %d new IDs", order_ref, len(existing_ids), len(new_ids))
         
         # Validate: Check if Order Reference in update file has same number of IDs as Ventrata
         validation_passed = True
@@ -996,9 +1151,7 @@ class NameExtractionProcessor:
             update_id_col = self.update_col_map.get('id')
             
             if update_order_ref_col and update_id_col:
-                update_rows_for_booking = self.update_df[
-                    self.update_df['_normalized_order_ref'] == norm_ref
-                ]
+                update_rows_for_booking = self.update_df.iloc[self.update_ref_positions.get(norm_ref, [])]
                 
                 if not update_rows_for_booking.empty:
                     # Get IDs from update file for this booking
@@ -1013,12 +1166,12 @@ class NameExtractionProcessor:
                     update_ids_set = set(update_ids_for_booking)
                     
                     if ventrata_ids_set != update_ids_set:
-                        logger.warning(f"ID mismatch for {order_ref}: Ventrata IDs {ventrata_ids_set} vs Update IDs {update_ids_set}")
+                        logger.warning("ID mismatch for %s: Ventrata IDs %s vs Update IDs %s", order_ref, ventrata_ids_set, update_ids_set)
                         validation_passed = False
         
         # If validation failed, re-extract everything
         if not validation_passed:
-            logger.info(f"Re-extracting {order_ref} due to ID mismatch")
+            logger.info("Re-extracting %s due to ID mismatch", order_ref)
             results = self._process_booking_normal(order_ref, norm_ref, ventrata_rows, booking_data)
             # Add error flag to all results
             for result in results:
@@ -1035,8 +1188,19 @@ class NameExtractionProcessor:
         results = []
         
         # Process existing IDs: Reuse from update file
+        if existing_ids:
+            # Travel Date comes from the booking's first Ventrata row, the same for every ID
+            first_row = ventrata_rows.iloc[0]
+            travel_date = self._format_travel_date_for_output(
+                self._extract_travel_date(first_row, monday_row=None, order_ref=order_ref)
+            )
+            monday_row = booking_data.get('monday_row') if isinstance(booking_data, dict) else None
+            if monday_row is not None and self.include_monday_columns:
+                monday_columns = self._get_monday_columns(monday_row)
+            else:
+                monday_columns = None
         for v_id in existing_ids:
-            update_row = self.update_id_map[v_id]
+            update_row = self._get_update_row(v_id)
             ventrata_row_for_id = ventrata_rows[ventrata_rows[id_col] == v_id].iloc[0]
             
             # Public Notes should reflect latest Ventrata info
@@ -1057,10 +1221,6 @@ class NameExtractionProcessor:
             unit_type_col = self.update_col_map.get('unit type')
             
             # Copy fields from Ventrata first
-            first_row = ventrata_rows.iloc[0]
-            travel_date_raw = self._extract_travel_date(first_row, monday_row=None, order_ref=order_ref)
-            travel_date = self._format_travel_date_for_output(travel_date_raw)
-            
             total_units = len(ventrata_rows)
             
             product_code_col = self.ventrata_col_map.get('product code')
@@ -1105,7 +1265,7 @@ class NameExtractionProcessor:
                     unit_type = 'Adult'
                     youth_converted = True
                     full_name = update_row[full_name_col] if full_name_col else ''
-                    logger.info(f"Update file non-EU: Converting Youth to Adult for {full_name} (country: {customer_country})")
+                    logger.info("Update file non-EU: Converting Youth to Adult for %s (country: %s)", full_name, customer_country)
             
             result = {
                 'Travel Date': travel_date,
@@ -1163,31 +1323,17 @@ class NameExtractionProcessor:
                 result['Ticket Time'] = tour_time
 
             # Add Monday columns if applicable (but don't overwrite update file values)
-            monday_row = booking_data.get('monday_row') if isinstance(booking_data, dict) else None
-            if is_colosseum_booking and should_include_monday_columns(self.scenario) and monday_row is not None:
+            if is_colosseum_booking and monday_columns is not None:
                 # Only use Monday values if update file didn't have them
                 if not result.get('PNR'):
-                    pnr_col = self.monday_col_map.get('ticket pnr') or self.monday_col_map.get('Ticket PNR')
-                    if not pnr_col:
-                        for col_name in monday_row.index:
-                            if 'pnr' in str(col_name).lower():
-                                pnr_col = col_name
-                                break
-                    
-                    pnr_value = ''
-                    if pnr_col and pnr_col in monday_row:
-                        pnr_value = monday_row[pnr_col] if not pd.isna(monday_row[pnr_col]) else ''
-                    result['PNR'] = pnr_value
-                
+                    result['PNR'] = monday_columns['PNR']
                 if not result.get('Ticket Group'):
-                    ticket_group_col = self.monday_col_map.get('ticket group')
-                    ticket_group_value = ''
-                    if ticket_group_col and ticket_group_col in monday_row:
-                        ticket_group_value = monday_row[ticket_group_col] if not pd.isna(monday_row[ticket_group_col]) else ''
-                    result['Ticket Group'] = ticket_group_value
+                    result['Ticket Group'] = monday_columns['Ticket Group']
                 
                 # Generate TIX NOM from PNR if we have one
-                if result.get('PNR'):
+                if result['PNR'] == monday_columns['PNR']:
+                    result['TIX NOM'] = monday_columns['TIX NOM']
+                elif result['PNR']:
                     result['TIX NOM'] = generate_tix_nom(result['PNR'])
                 else:
                     result['TIX NOM'] = ''
@@ -1196,14 +1342,14 @@ class NameExtractionProcessor:
         
         # Process new IDs: Extract normally
         if new_ids:
-            logger.info(f"Extracting {len(new_ids)} new travelers for {order_ref}")
+            logger.info("Extracting %d new travelers for %s", len(new_ids), order_ref)
             
             # Get preserved values from update file for this booking (from existing IDs)
             # These values are typically the same for all rows in a booking
             booking_preserved_values = {}
             if existing_ids:
                 first_existing_id = existing_ids[0]
-                first_update_row = self.update_id_map[first_existing_id]
+                first_update_row = self._get_update_row(first_existing_id)
                 
                 # Columns to preserve from update file for new IDs in same booking
                 preserve_cols = ['tag', 'notes', 'pnr', 'change by', 'ticket group', 'codice', 'sigilo']
@@ -1242,7 +1388,7 @@ class NameExtractionProcessor:
         
         return results
     
-    def _process_booking_normal(self, order_ref, norm_ref, ventrata_rows, booking_data):
+    def _process_booking_normal(self, order_ref, norm_ref, ventrata_rows, booking_data, unit_counts=None):
         """
         Normal booking processing without update file (original logic).
         
@@ -1251,6 +1397,7 @@ class NameExtractionProcessor:
             norm_ref: Normalized order reference
             ventrata_rows: DataFrame with Ventrata rows
             booking_data: Dict with booking info
+            unit_counts: Unit type counts of ventrata_rows, if already computed
             
         Returns:
             list: List of result dicts
@@ -1261,10 +1408,15 @@ class NameExtractionProcessor:
         reseller_col = self.ventrata_col_map.get('reseller')
         reseller = str(first_row[reseller_col]) if reseller_col and reseller_col in first_row else ''
         
+        # Unit type counts of these rows, counted once and shared by every check below
+        unit_col = self.ventrata_col_map.get('unit')
+        if unit_counts is None:
+            unit_counts = get_unit_counts(ventrata_rows, unit_col) if unit_col else {}
+        
         # Identify extractor type
         extractor_type = self._identify_extractor_type(reseller)
         
-        logger.debug(f"Processing order {order_ref} with {extractor_type} extractor")
+        logger.debug("Processing order %s with %s extractor", order_ref, extractor_type)
         
         # Extract travelers
         public_notes_col = self.ventrata_col_map.get('public notes')
@@ -1278,13 +1430,14 @@ class NameExtractionProcessor:
         monday_row = booking_data.get('monday_row') if isinstance(booking_data, dict) else None
         
         # Build booking data dict with both Ventrata and Monday data
-        booking_data = self._build_booking_data_dict(first_row, monday_row)
+        booking_data = self._build_booking_data_dict(first_row, monday_row, order_ref=order_ref)
         
         # Preserve monday_row in booking_data for later use
         if monday_row is not None:
             booking_data['monday_row'] = monday_row
         
-        travel_date_raw = self._extract_travel_date(first_row, monday_row=None, order_ref=order_ref)
+        # Same first row, so reuse the travel date the booking data dict already extracted
+        travel_date_raw = booking_data['travel_date']
 
         # For non-GYG, pass booking data for structured column access
         if extractor_type == 'non_gyg':
@@ -1299,21 +1452,24 @@ class NameExtractionProcessor:
             id_col = self.ventrata_col_map.get('id')
             
             if not id_col:
-                logger.warning(f"ID column not found in Ventrata file for {order_ref}")
+                logger.warning("ID column not found in Ventrata file for %s", order_ref)
             
-            # Extract all travelers first (with their unit types)
-            for _, row in ventrata_rows.iterrows():
+            # Extract all travelers first (with their unit types); rows as plain dicts,
+            # which _build_booking_data_dict and _extract_travel_date read like a Series
+            columns = ventrata_rows.columns
+            for values in ventrata_rows.to_numpy(dtype=object):
+                row = dict(zip(columns, values))
                 # Build booking data with Monday row if available
                 row_booking_data = self._build_booking_data_dict(row, monday_row)
                 row_travelers = self.extractors['non_gyg'].extract_travelers(public_notes, order_ref, row_booking_data)
                 
                 # Add Ventrata ID to each traveler (non-GYG: 1-to-1 mapping)
-                if id_col and id_col in row.index:
+                if id_col and id_col in row:
                     ventrata_id = row[id_col]
                 else:
                     ventrata_id = ''
                     if id_col:
-                        logger.debug(f"ID column '{id_col}' not in row for {order_ref}")
+                        logger.debug("ID column '%s' not in row for %s", id_col, order_ref)
                 
                 for traveler in row_travelers:
                     traveler['ventrata_id'] = ventrata_id
@@ -1343,7 +1499,7 @@ class NameExtractionProcessor:
                             if age is not None:
                                 traveler['age'] = age
                                 # Age flags will be updated later based on country
-                                logger.debug(f"[Non-GYG] Added DOB {dob_str} (age {age:.1f}) to {traveler['name']}")
+                                logger.debug("[Non-GYG] Added DOB %s (age %.1f) to %s", dob_str, age, traveler['name'])
                     
                     traveler_index += 1
             
@@ -1354,33 +1510,33 @@ class NameExtractionProcessor:
                 if travelers:
                     if missing_units:
                         self.bookings_require_unit_check.add(norm_ref)
-                    logger.info(f"Private notes template extracted {len(travelers)} travelers for {order_ref}")
+                    logger.info("Private notes template extracted %d travelers for %s", len(travelers), order_ref)
                 else:
-                    logger.warning(f"Non-GYG structured extraction failed for {order_ref}, no names found")
+                    logger.warning("Non-GYG structured extraction failed for %s, no names found", order_ref)
         
         elif extractor_type in ['gyg_standard', 'gyg_mda']:
             # For ALL GYG bookings: Try GYG Standard first, fall back to GYG MDA if it fails
-            logger.debug(f"Trying GYG Standard extraction first for order {order_ref}")
+            logger.debug("Trying GYG Standard extraction first for order %s", order_ref)
             travelers = self.extractors['gyg_standard'].extract_travelers(public_notes, order_ref, booking_data)
             
             if not travelers:
                 # GYG Standard failed, fall back to GYG MDA patterns
-                logger.info(f"GYG Standard extraction failed for {order_ref}, falling back to GYG MDA patterns")
+                logger.info("GYG Standard extraction failed for %s, falling back to GYG MDA patterns", order_ref)
                 travelers = self.extractors['gyg_mda'].extract_travelers(public_notes, order_ref, booking_data)
                 
                 if not travelers:
                     # Both GYG Standard and MDA failed; try private notes parser
-                    logger.warning(f"All extraction methods failed for GYG order {order_ref}, using private notes template")
+                    logger.warning("All extraction methods failed for GYG order %s, using private notes template", order_ref)
                     unit_col = self.ventrata_col_map.get('unit')
                     travelers, missing_units = build_travelers_from_private_notes(private_notes, ventrata_rows, unit_col, travel_date_raw)
                     if travelers:
                         if missing_units:
                             self.bookings_require_unit_check.add(norm_ref)
-                        logger.info(f"Private notes template extracted {len(travelers)} travelers for {order_ref}")
+                        logger.info("Private notes template extracted %d travelers for %s", len(travelers), order_ref)
                 else:
-                    logger.info(f"GYG MDA fallback successful for {order_ref}: extracted {len(travelers)} travelers")
+                    logger.info("GYG MDA fallback successful for %s: extracted %d travelers", order_ref, len(travelers))
             else:
-                logger.debug(f"GYG Standard extraction successful for {order_ref}: extracted {len(travelers)} travelers")
+                logger.debug("GYG Standard extraction successful for %s: extracted %d travelers", order_ref, len(travelers))
             
             # For GYG bookings: supplement/replace missing DOBs from private notes if available
             # This helps with unit type assignment when DOBs are missing in public notes
@@ -1401,7 +1557,7 @@ class NameExtractionProcessor:
         # Sort travelers alphabetically within this booking (A-Z)
         if travelers:
             travelers.sort(key=lambda t: t.get('name', '').lower())
-            logger.debug(f"Sorted {len(travelers)} travelers alphabetically for {order_ref}")
+            logger.debug("Sorted %d travelers alphabetically for %s", len(travelers), order_ref)
         
         # Get customer country early to update age flags
         customer_country_col = self.ventrata_col_map.get('customer country')
@@ -1428,7 +1584,7 @@ class NameExtractionProcessor:
                 platform_name = 'GYG Standard'  # Default
             
             booking_errors = self._calculate_gyg_booking_errors(
-                travelers, ventrata_rows, platform_name, travel_date_raw
+                travelers, ventrata_rows, platform_name, travel_date_raw, unit_counts
             )
         elif extractor_type == 'non_gyg':
             # Check unit count mismatch for non-GYG bookings
@@ -1447,9 +1603,6 @@ class NameExtractionProcessor:
             if total_units != total_travelers:
                 unit_col = self.ventrata_col_map.get('unit')
                 if unit_col:
-                    # Count units by type from ventrata_rows
-                    unit_counts = get_unit_counts(ventrata_rows, unit_col)
-                    
                     # Count travelers by unit type (use original_unit_type if available)
                     traveler_unit_counts = {}
                     for traveler in travelers:
@@ -1476,8 +1629,8 @@ class NameExtractionProcessor:
         # Get booking-level info
         total_units = len(ventrata_rows)
         
-        # Extract travel_date from Ventrata only (handles both merged and non-merged scenarios)
-        travel_date = travel_date_raw
+        # Travel Date for output (from Ventrata only), shared by every row of the booking
+        travel_date = self._format_travel_date_for_output(travel_date_raw)
         
         # Get tour info
         product_code_col = self.ventrata_col_map.get('product code')
@@ -1505,9 +1658,6 @@ class NameExtractionProcessor:
         
         # Assign unit types if we have travelers
         if travelers:
-            unit_col = self.ventrata_col_map.get('unit')
-            unit_counts = get_unit_counts(ventrata_rows, unit_col) if unit_col else {}
-            
             if extractor_type != 'non_gyg':
                 # Check if unit types are already assigned (e.g., by fallback extractors)
                 has_unit_types = all(t.get('unit_type') is not None for t in travelers)
@@ -1522,7 +1672,7 @@ class NameExtractionProcessor:
                         is_gyg
                     )
                 else:
-                    logger.debug(f"Unit types already assigned for {order_ref}, skipping assignment")
+                    logger.debug("Unit types already assigned for %s, skipping assignment", order_ref)
                 
                 # Only apply smart matching if we have age data (DOB-based resellers like GYG/Viator)
                 has_age_data = any(t.get('age') is not None for t in travelers)
@@ -1538,7 +1688,7 @@ class NameExtractionProcessor:
                             traveler['original_unit_type'] = unit_type
                         if '_original_unit_type_for_validation' not in traveler:
                             traveler['_original_unit_type_for_validation'] = unit_type
-                    logger.debug(f"No age data for {order_ref}, skipping smart matching - using unit types as provided")
+                    logger.debug("No age data for %s, skipping smart matching - using unit types as provided", order_ref)
             else:
                 # Non-GYG bookings: Only apply smart matching if we have age data
                 has_age_data = any(t.get('age') is not None for t in travelers)
@@ -1554,7 +1704,7 @@ class NameExtractionProcessor:
                             traveler['original_unit_type'] = unit_type
                         if '_original_unit_type_for_validation' not in traveler:
                             traveler['_original_unit_type_for_validation'] = unit_type
-                    logger.debug(f"No age data for {order_ref}, skipping smart matching - using unit types as provided")
+                    logger.debug("No age data for %s, skipping smart matching - using unit types as provided", order_ref)
             
             # For GYG: Map travelers to Ventrata row IDs by unit type (requires unit_type)
             # ID mapping must happen BEFORE Infant->Child conversion to match Ventrata's unit types
@@ -1570,12 +1720,9 @@ class NameExtractionProcessor:
                         converted = convert_infant_to_child_for_colosseum(unit_type, product_tags_str)
                         if converted != unit_type:
                             traveler['unit_type'] = converted
-                            logger.debug(f"Converted {unit_type} to {converted} for Colosseum booking")
+                            logger.debug("Converted %s to %s for Colosseum booking", unit_type, converted)
         
         # Check for youth validation (EU countries only)
-        unit_col = self.ventrata_col_map.get('unit')
-        unit_counts = get_unit_counts(ventrata_rows, unit_col) if unit_col else {}
-        
         youth_errors = validate_youth_booking(travelers, unit_counts, customer_country, is_gyg, is_colosseum_booking)
         
         # Check for individual age/unit type mismatches (e.g., Youth booked but age is Child/Adult)
@@ -1591,6 +1738,24 @@ class NameExtractionProcessor:
         if age_unit_errors:
             booking_errors.extend(age_unit_errors)
         
+        # Special handling for Gold Hour / Twilight product
+        if product_code == 'ROMARNEVEENG':
+            language = 'Gold Hour / Twilight'
+        
+        # Monday-specific columns are the same for every row of the booking; only added
+        # if a Monday file is provided, which keeps Ventrata-only output clean
+        monday_columns = None
+        if is_colosseum_booking and self.include_monday_columns:
+            if 'monday_row' in booking_data:
+                monday_columns = self._get_monday_columns(booking_data['monday_row'])
+                pnr_value = monday_columns['PNR']
+                logger.debug("Added Monday columns for %s: PNR=%s, TIX NOM=%s", order_ref, pnr_value[:20] if pnr_value else 'empty', monday_columns['TIX NOM'])
+            else:
+                if travelers:
+                    # Monday file provided but no monday_row in booking_data
+                    logger.warning("Monday file provided but no monday_row found for order %s", order_ref)
+                monday_columns = {'PNR': '', 'Ticket Group': '', 'TIX NOM': ''}
+        
         # Build results for each traveler
         results = []
         if travelers:
@@ -1612,14 +1777,6 @@ class NameExtractionProcessor:
                 if name_has_forbidden_issue(traveler['name']):
                     traveler_errors.append("Please Check Names before Insertion")
                 
-                # Get Travel Date for output (from Ventrata only)
-                travel_date_raw = self._extract_travel_date(first_row, monday_row=None, order_ref=order_ref)
-                travel_date = self._format_travel_date_for_output(travel_date_raw)
-                
-                # Special handling for Gold Hour / Twilight product
-                if product_code == 'ROMARNEVEENG':
-                    language = 'Gold Hour / Twilight'
-                
                 # Build result dict with reordered columns
                 result = {
                     'Travel Date': travel_date,
@@ -1668,59 +1825,13 @@ class NameExtractionProcessor:
                         result['Error'] = unit_error
                     result['_highlight_yellow'] = True
                 
-                # Add Monday-specific columns ONLY if Monday file is provided
-                # This keeps the output clean for Ventrata-only scenarios
-                if is_colosseum_booking and should_include_monday_columns(self.scenario):
-                    if 'monday_row' in booking_data:
-                        monday_row = booking_data['monday_row']
-                        
-                        # Extract PNR
-                        # Try both 'ticket pnr' and 'Ticket PNR' for case-insensitive matching
-                        pnr_col = self.monday_col_map.get('ticket pnr') or self.monday_col_map.get('Ticket PNR')
-                        if not pnr_col:
-                            # Fallback: search for column containing 'pnr' (case-insensitive)
-                            for col_name in monday_row.index:
-                                if 'pnr' in str(col_name).lower():
-                                    pnr_col = col_name
-                                    break
-                        
-                        pnr_value = ''
-                        if pnr_col and pnr_col in monday_row:
-                            pnr_value = monday_row[pnr_col] if not pd.isna(monday_row[pnr_col]) else ''
-                        result['PNR'] = pnr_value
-                        
-                        # Extract Ticket Group
-                        ticket_group_col = self.monday_col_map.get('ticket group')
-                        ticket_group_value = ''
-                        if ticket_group_col and ticket_group_col in monday_row:
-                            ticket_group_value = monday_row[ticket_group_col] if not pd.isna(monday_row[ticket_group_col]) else ''
-                        result['Ticket Group'] = ticket_group_value
-                        
-                        # Generate TIX NOM from PNR
-                        if pnr_value:
-                            result['TIX NOM'] = generate_tix_nom(pnr_value)
-                        else:
-                            result['TIX NOM'] = ''
-                        
-                        logger.debug(f"Added Monday columns for {order_ref}: PNR={pnr_value[:20] if pnr_value else 'empty'}, TIX NOM={result.get('TIX NOM', '')}")
-                    else:
-                        # Monday file provided but no monday_row in booking_data
-                        logger.warning(f"Monday file provided but no monday_row found for order {order_ref}")
-                        result['PNR'] = ''
-                        result['Ticket Group'] = ''
-                        result['TIX NOM'] = ''
+                if monday_columns is not None:
+                    result.update(monday_columns)
                 
                 results.append(result)
         else:
             # No travelers extracted - still create a row with error
-            logger.warning(f"No travelers extracted for {order_ref}, creating empty result with error")
-            
-            travel_date_raw = self._extract_travel_date(first_row, monday_row=None, order_ref=order_ref)
-            travel_date = self._format_travel_date_for_output(travel_date_raw)
-            
-            # Special handling for Gold Hour / Twilight product
-            if product_code == 'ROMARNEVEENG':
-                language = 'Gold Hour / Twilight'
+            logger.warning("No travelers extracted for %s, creating empty result with error", order_ref)
             
             # Aggregate all errors
             traveler_errors = list(booking_errors)  # Copy booking-level errors
@@ -1774,46 +1885,15 @@ class NameExtractionProcessor:
                 result['_highlight_yellow'] = True
             
             # Add Monday-specific columns if applicable
-            if is_colosseum_booking and should_include_monday_columns(self.scenario):
-                if 'monday_row' in booking_data:
-                    monday_row = booking_data['monday_row']
-                    
-                    # Extract PNR
-                    pnr_col = self.monday_col_map.get('ticket pnr') or self.monday_col_map.get('Ticket PNR')
-                    if not pnr_col:
-                            for col_name in monday_row.index:
-                                if 'pnr' in str(col_name).lower():
-                                    pnr_col = col_name
-                                    break
-                    
-                    pnr_value = ''
-                    if pnr_col and pnr_col in monday_row:
-                        pnr_value = monday_row[pnr_col] if not pd.isna(monday_row[pnr_col]) else ''
-                    result['PNR'] = pnr_value
-                    
-                    # Extract Ticket Group
-                    ticket_group_col = self.monday_col_map.get('ticket group')
-                    ticket_group_value = ''
-                    if ticket_group_col and ticket_group_col in monday_row:
-                        ticket_group_value = monday_row[ticket_group_col] if not pd.isna(monday_row[ticket_group_col]) else ''
-                    result['Ticket Group'] = ticket_group_value
-                    
-                    # Generate TIX NOM from PNR
-                    if pnr_value:
-                        result['TIX NOM'] = generate_tix_nom(pnr_value)
-                    else:
-                        result['TIX NOM'] = ''
-                else:
-                    result['PNR'] = ''
-                    result['Ticket Group'] = ''
-                    result['TIX NOM'] = ''
+            if monday_columns is not None:
+                result.update(monday_columns)
             
             results.append(result)
         
         # Check for duplicate names within this booking; if found, try resolving via private notes
         has_dupes, duplicate_names = check_duplicates_in_booking(travelers)
         if has_dupes:
-            logger.info(f"[DupCheck] {order_ref} has duplicates: {duplicate_names}, {travelers}")
+            logger.info("[DupCheck] %s has duplicates: %s, %s", order_ref, duplicate_names, travelers)
         if has_dupes:
             unit_col = self.ventrata_col_map.get('unit')
             parser_travelers, _ = build_travelers_from_private_notes(private_notes, ventrata_rows, unit_col, travel_date_raw)
@@ -1821,14 +1901,14 @@ class NameExtractionProcessor:
             resolved_duplicates = False
 
             if parser_travelers:
-                logger.info(f"[DupCheck] Parser returned {len(parser_travelers)} travelers for {order_ref}")
+                logger.info("[DupCheck] Parser returned %d travelers for %s", len(parser_travelers), order_ref)
                 booking_units = []
                 if unit_col and unit_col in ventrata_rows.columns:
                     for _, row in ventrata_rows.iterrows():
                         unit_val = row.get(unit_col)
                         if pd.notna(unit_val) and str(unit_val).strip():
                             booking_units.append(str(unit_val).strip())
-                logger.info(f"[DupCheck] Booking units for {order_ref}: {booking_units}")
+                logger.info("[DupCheck] Booking units for %s: %s", order_ref, booking_units)
 
                 def _normalize_unit(value):
                     if value is None:
@@ -1837,7 +1917,7 @@ class NameExtractionProcessor:
 
                 parser_units = [_normalize_unit(p.get('unit_type')) for p in parser_travelers]
                 booking_units_norm = [_normalize_unit(u) for u in booking_units]
-                logger.info(f"[DupCheck] Parser units for {order_ref}: {parser_units}")
+                logger.info("[DupCheck] Parser units for %s: %s", order_ref, parser_units)
 
                 parser_unit_counts = Counter(parser_units)
                 booking_unit_counts = Counter(booking_units_norm)
@@ -1860,20 +1940,20 @@ class NameExtractionProcessor:
                             reordered_travelers.append(traveler)
                         else:
                             reorder_failed = True
-                            logger.warning(f"[DupCheck] Could not reorder parser travelers for unit {unit_norm} in {order_ref}")
+                            logger.warning("[DupCheck] Could not reorder parser travelers for unit %s in %s", unit_norm, order_ref)
                             break
 
                     if reorder_failed:
-                        logger.info(f"[DupCheck] Parser traveler reordering failed for {order_ref}")
+                        logger.info("[DupCheck] Parser traveler reordering failed for %s", order_ref)
                         reordered_travelers = []
 
                 else:
                     # Unit types don't match but check if we have the right number of travelers
                     if booking_units_norm and len(parser_travelers) == len(booking_units_norm):
                         # Use private notes travelers but assign booking units to them
-                        logger.info(f"[DupCheck] Unit types mismatch but traveler count matches for {order_ref}: "
-                                    f"parser={parser_unit_counts}, booking={booking_unit_counts}. "
-                                    f"Using private notes travelers with booking units.")
+                        logger.info("[DupCheck] Unit types mismatch but traveler count matches for %s: "
+                                    "parser=%s, booking=%s. Using private notes travelers with booking units.",
+                                    order_ref, parser_unit_counts, booking_unit_counts)
                         
                         # Assign booking units to parser travelers
                         # (Possible Youth flagging will happen in validate_youth_booking)
@@ -1892,19 +1972,16 @@ class NameExtractionProcessor:
                     else:
                         reordered_travelers = []
                         if booking_units_norm:
-                            logger.info(f"[DupCheck] Unit counts mismatch for {order_ref}: parser={parser_unit_counts}, booking={booking_unit_counts}")
+                            logger.info("[DupCheck] Unit counts mismatch for %s: parser=%s, booking=%s", order_ref, parser_unit_counts, booking_unit_counts)
                         else:
-                            logger.info(f"[DupCheck] No booking units found for {order_ref}")
+                            logger.info("[DupCheck] No booking units found for %s", order_ref)
 
                 if reordered_travelers:
                     parser_travelers = reordered_travelers
-                    logger.info(f"[DupCheck] Units match for {order_ref}; swapping to parser travelers")
+                    logger.info("[DupCheck] Units match for %s; swapping to parser travelers", order_ref)
                     if extractor_type in ['gyg_standard', 'gyg_mda']:
                         parser_travelers = self._map_travelers_to_ids(parser_travelers, ventrata_rows, order_ref)
-                        logger.info(f"[DupCheck] Parser travelers mapped to IDs for {order_ref}")
-
-                    unit_col = self.ventrata_col_map.get('unit')
-                    unit_counts = get_unit_counts(ventrata_rows, unit_col) if unit_col else {}
+                        logger.info("[DupCheck] Parser travelers mapped to IDs for %s", order_ref)
 
                     has_unit_types = all(t.get('unit_type') is not None for t in parser_travelers)
                     if extractor_type != 'non_gyg' and not has_unit_types:
@@ -1930,7 +2007,7 @@ class NameExtractionProcessor:
                                 traveler['original_unit_type'] = unit_type
                             if '_original_unit_type_for_validation' not in traveler:
                                 traveler['_original_unit_type_for_validation'] = unit_type
-                        logger.debug(f"No age data for {order_ref}, skipping smart matching in dup resolution")
+                        logger.debug("No age data for %s, skipping smart matching in dup resolution", order_ref)
 
                     if product_tags_str:
                         for traveler in parser_travelers:
@@ -1945,14 +2022,14 @@ class NameExtractionProcessor:
                         if idx >= len(results):
                             break
                         result = results[idx]
-                        logger.info(f"[DupCheck] Updating row {idx} for {order_ref} -> {traveler['name']} ({traveler.get('unit_type')})")
+                        logger.info("[DupCheck] Updating row %s for %s -> %s (%s)", idx, order_ref, traveler['name'], traveler.get('unit_type'))
                         result['Full Name'] = traveler['name']
                         result['Unit Type'] = traveler.get('unit_type', '')
                         if extractor_type in ['gyg_standard', 'gyg_mda']:
                             result['ID'] = traveler.get('ventrata_id', result.get('ID', ''))
 
                     resolved_duplicates = True
-                    logger.info(f"Resolved duplicate names for {order_ref} using private notes parser")
+                    logger.info("Resolved duplicate names for %s using private notes parser", order_ref)
 
             if not resolved_duplicates:
                 dup_error = "Duplicated names in the booking"
@@ -1989,3 +2066,115 @@ class NameExtractionProcessor:
         
         return results_df
 
+
+
+# Update file shared with shard worker processes (set once per process by the pool initializer)
+_shard_update_df = None
+
+
+def _init_shard_worker(update_df):
+    """Pool initializer: receive the update file once per worker process."""
+    global _shard_update_df
+    _shard_update_df = update_df
+
+
+def _process_shard(shard):
+    """Process one shard of bookings in a worker process."""
+    ventrata_shard, monday_shard = shard
+    processor = NameExtractionProcessor(
+        ventrata_shard, monday_shard, _shard_update_df, validate_travel_dates=False
+    )
+    return processor.process()
+
+
+def process_in_parallel(ventrata_df, monday_df=None, update_df=None, max_workers=None):
+    """
+    Run name extraction with bookings sharded across worker processes.
+    
+    Bookings are split into contiguous groups of normalized order references,
+    in processing order (Monday order if provided, otherwise Ventrata order),
+    so every booking is handled by exactly one process and concatenating the
+    shard results keeps the single-process row and column order.
+    
+    Inputs with fewer than PARALLEL_MIN_BOOKINGS bookings, and pool failures,
+    run in-process.
+    
+    Args:
+        ventrata_df: Ventrata (or merged Ventrata+Monday) DataFrame
+        monday_df: Monday DataFrame (optional)
+        update_df: Update file DataFrame (optional), sent once per worker process
+        max_workers: Number of worker processes (default: CPU count)
+        
+    Returns:
+        pd.DataFrame: Same result as NameExtractionProcessor(...).process()
+    """
+    # Travel dates are validated once for the full input; shards and the in-process
+    # path skip the check
+    ventrata_col_map = standardize_column_names(ventrata_df)
+    if update_df is not None:
+        NameExtractionProcessor._validate_travel_dates(
+            ventrata_df, update_df, ventrata_col_map, standardize_column_names(update_df)
+        )
+    
+    def process_serially():
+        processor = NameExtractionProcessor(ventrata_df, monday_df, update_df, validate_travel_dates=False)
+        return processor.process()
+    
+    order_source = monday_df if monday_df is not None else ventrata_df
+    order_col = (standardize_column_names(monday_df) if monday_df is not None else ventrata_col_map).get('order reference')
+    if not order_col or any('_normalized_order_ref' not in df.columns
+                            for df in (ventrata_df, monday_df) if df is not None):
+        return process_serially()
+    
+    ordered_refs = order_source.loc[order_source[order_col].notna(), '_normalized_order_ref'].unique().tolist()
+    max_workers = max_workers or os.cpu_count() or 1
+    if max_workers < 2 or len(ordered_refs) < PARALLEL_MIN_BOOKINGS:
+        return process_serially()
+    
+    # Every shard needs Ventrata rows (a processor without them raises), so Monday-only
+    # references are carried into the next shard, or the last one at the end
+    ventrata_refs = set(ventrata_df['_normalized_order_ref'].dropna())
+    shard_size = -(-len(ordered_refs) // max_workers)  # ceil division
+    shard_refs = []
+    pending_refs = []
+    for start in range(0, len(ordered_refs), shard_size):
+        refs = pending_refs + ordered_refs[start:start + shard_size]
+        if any(ref in ventrata_refs for ref in refs):
+            shard_refs.append(refs)
+            pending_refs = []
+        else:
+            pending_refs = refs
+    if pending_refs and shard_refs:
+        shard_refs[-1].extend(pending_refs)
+    if len(shard_refs) < 2:
+        return process_serially()
+    
+    shards = []
+    for refs in shard_refs:
+        refs = set(refs)
+        ventrata_shard = ventrata_df[ventrata_df['_normalized_order_ref'].isin(refs)]
+        monday_shard = None
+        if monday_df is not None:
+            monday_shard = monday_df[monday_df['_normalized_order_ref'].isin(refs)]
+        shards.append((ventrata_shard, monday_shard))
+    
+    logger.info("Processing %d bookings in %d shards across %d processes",
+                len(ordered_refs), len(shards), max_workers)
+    try:
+        # Spawned workers never inherit locks held by other threads (the GUI runs
+        # this from a QThread), and match Windows/macOS behaviour on every platform
+        with ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context('spawn'),
+                                 initializer=_init_shard_worker, initargs=(update_df,)) as executor:
+            parts = list(executor.map(_process_shard, shards))
+    except Exception as e:
+        logger.warning("Parallel processing failed (%s), processing in a single process", e)
+        return process_serially()
+    
+    parts = [part for part in parts if not part.empty]
+    if not parts:
+        logger.warning("No data extracted - returning empty DataFrame")
+        return pd.DataFrame()
+    
+    results_df = pd.concat(parts, ignore_index=True)
+    logger.info("Name extraction complete: %d entries processed", len(results_df))
+    return results_df
@@ -4,6 +4,7 @@ Utility functions for data normalization and transformation.
 
 from .normalization import (
     normalize_ref,
+    normalize_ref_series,
     normalize_time,
     extract_language_from_product_code,
     extract_tour_type_from_product_code,
@@ -32,6 +33,7 @@ from .scenario_handler import (
 
 __all__ = [
     'normalize_ref',
+    'normalize_ref_series',
     'normalize_time',
     'extract_language_from_product_code',
     'extract_tour_type_from_product_code',
@@ -16,6 +16,9 @@ from config import LANGUAGE_MAP, TOUR_TYPE_PATTERNS
 
 logger = logging.getLogger(__name__)
 
+# Everything that is not a lowercase letter or digit (whitespace and separators included)
+_REF_STRIP_PATTERN = re.compile(r'[^a-z0-9]')
+
 
 def normalize_ref(ref):
     """
@@ -38,12 +41,21 @@ def normalize_ref(ref):
     if pd.isna(ref) or ref is None:
         return ""
     
-    ref_str = str(ref).lower()
-    ref_str = re.sub(r'\s+', '', ref_str)
-    ref_str = re.sub(r'[-_.\\/]', '', ref_str)  
-    ref_str = re.sub(r'[^a-z0-9]', '', ref_str)
+    return _REF_STRIP_PATTERN.sub('', str(ref).lower())
+
+
+def normalize_ref_series(refs):
+    """
+    Vectorized normalize_ref for a whole column of order references.
     
-    return ref_str
+    Args:
+        refs: Series of order references
+        
+    Returns:
+        pd.Series: Normalized lowercase references ("" for missing values)
+    """
+    normalized = refs.astype(str).str.lower().str.replace(_REF_STRIP_PATTERN, '', regex=True)
+    return normalized.where(refs.notna(), '')
 
 
 def normalize_travel_date(date_value):
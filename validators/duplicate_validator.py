@@ -7,9 +7,13 @@ ignoring unit type indicators like "(Adult)" or "(Child)".
 
 import re
 import logging
+from collections import Counter
 
 logger = logging.getLogger(__name__)
 
+# Trailing unit type indicator, e.g. " (Adult)"
+_UNIT_SUFFIX_PATTERN = re.compile(r'\s*\([^)]*\)\s*$')
+
 
 def check_duplicates_in_booking(travelers_list):
     """
@@ -41,7 +45,7 @@ def check_duplicates_in_booking(travelers_list):
         full_name = str(traveler.get('name', '')).strip()
         if full_name:
             # Remove unit type indicators like "(Adult)", "(Child)"
-            base_name = re.sub(r'\s*\([^)]*\)\s*$', '', full_name).strip()
+            base_name = _UNIT_SUFFIX_PATTERN.sub('', full_name).strip()
             names_in_booking.append((base_name, full_name))
     
     # Check for duplicates based on base names
@@ -50,9 +54,9 @@ def check_duplicates_in_booking(travelers_list):
     
     if len(base_names) != len(unique_base_names): #if the length of the base names is not equal to the length of the unique base names, then there are duplicates
         duplicate_names = []
+        base_name_counts = Counter(base_names)
         for base_name in unique_base_names:
-            count = base_names.count(base_name)
-            if count > 1:
+            if base_name_counts[base_name] > 1:
                 # Find all full names that have this base name
                 matching_full_names = [full for base, full in names_in_booking if base == base_name]
                 duplicate_names.extend(matching_full_names)
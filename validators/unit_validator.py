@@ -110,8 +110,8 @@ def check_only_child_infant(unit_counts):
     Returns:
         str: Error message if only children, empty string otherwise
     """
-    child_count = sum(unit_counts.get(unit, 0) for unit in ['Child', 'Infant'])
-    adult_count = sum(unit_counts.get(unit, 0) for unit in ['Adult', 'Youth'])
+    child_count = unit_counts.get('Child', 0) + unit_counts.get('Infant', 0)
+    adult_count = unit_counts.get('Adult', 0) + unit_counts.get('Youth', 0)
     
     if child_count > 0 and adult_count == 0:
         error = "Booking has only Child/Infant units"
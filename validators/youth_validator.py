@@ -97,7 +97,7 @@ def validate_youth_booking(travelers, unit_counts, customer_country, is_gyg=Fals
         child_travelers = sum(1 for t in travelers if t.get('is_child_by_age', False))
         adult_travelers = sum(1 for t in travelers if t.get('is_adult_by_age', False))
         
-        child_unit_count = sum(unit_counts.get(unit, 0) for unit in ['Child', 'Infant'])
+        child_unit_count = unit_counts.get('Child', 0) + unit_counts.get('Infant', 0)
         adult_unit_count = unit_counts.get('Adult', 0)
         
         # Check unit count mismatches